@@ -6,9 +6,12 @@ and reads progression plans from target learning projects.
 
 from __future__ import annotations
 
+import collections.abc
+import heapq
+import os
 import pathlib
-import re
 import tomllib
+import typing as t
 
 from .builtin_templates import get_builtin_template
 from .models import (
@@ -22,11 +25,153 @@ from .models import (
 from .project_registry import get_project_path
 
 #: Maps template categories to source directories to scan.
-_SOURCE_DIRS: dict[TemplateCategory, list[str]] = {
-    TemplateCategory.LESSON_BASED: ["src"],
-    TemplateCategory.APP_BASED: ["app", "src"],
+_SOURCE_DIRS: dict[TemplateCategory, tuple[str, ...]] = {
+    TemplateCategory.LESSON_BASED: ("src",),
+    TemplateCategory.APP_BASED: ("app", "src"),
 }
 
+#: Every candidate source directory across categories, deduplicated in order.
+_ALL_SOURCE_DIRS: tuple[str, ...] = tuple(
+    dict.fromkeys(d for category_dirs in _SOURCE_DIRS.values() for d in category_dirs)
+)
+
+#: Source directories per project, resolved through its category once.
+_PROJECT_SOURCE_DIRS: dict[TargetProject, tuple[str, ...]] = {
+    project: _SOURCE_DIRS[
+        PROJECT_CATEGORIES.get(project, TemplateCategory.LESSON_BASED)
+    ]
+    for project in TargetProject
+}
+
+#: Parsed pyproject.toml data keyed by path, stamped with ``(st_mtime_ns, st_size)``.
+_PYPROJECT_CACHE: dict[str, tuple[tuple[int, int], dict[str, t.Any]]] = {}
+
+#: Text file contents keyed by path, stamped with ``(st_mtime_ns, st_size)``.
+_TEXT_CACHE: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def _file_stamp(path: pathlib.Path) -> tuple[int, int]:
+    """Return a cheap change-detection stamp for a file."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_pyproject(pyproject_path: pathlib.Path) -> dict[str, t.Any]:
+    """Parse a pyproject.toml, reusing the previous result if unchanged."""
+    key = str(pyproject_path)
+    stamp = _file_stamp(pyproject_path)
+    cached = _PYPROJECT_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+    _PYPROJECT_CACHE[key] = (stamp, data)
+    return data
+
+
+def _read_text_cached(path: pathlib.Path) -> str:
+    """Read a UTF-8 text file, reusing the previous result if unchanged."""
+    key = str(path)
+    stamp = _file_stamp(path)
+    cached = _TEXT_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    text = path.read_text(encoding="utf-8")
+    _TEXT_CACHE[key] = (stamp, text)
+    return text
+
+
+def _read_optional_text(path: pathlib.Path) -> str:
+    """Read a text file via the cache, returning ``""`` if it is missing."""
+    try:
+        return _read_text_cached(path)
+    except FileNotFoundError:
+        return ""
+
+
+def _iter_py_files(
+    source_path: pathlib.Path,
+) -> collections.abc.Iterator[tuple[str, list[str]]]:
+    """Yield ``(dirpath, filenames)`` for non-dunder ``.py`` files, unsorted."""
+    for dirpath, dirnames, filenames in os.walk(source_path):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        names = [n for n in filenames if n.endswith(".py") and not n.startswith("__")]
+        if names:
+            yield dirpath, names
+
+
+def _walk_py_files(
+    source_path: pathlib.Path,
+    project_path: pathlib.Path,
+    limit: int | None = None,
+) -> list[tuple[str, str]]:
+    """List non-dunder ``.py`` files under a source directory in one walk.
+
+    Parameters
+    ----------
+    source_path : pathlib.Path
+        Directory to walk recursively.
+    project_path : pathlib.Path
+        Project root that returned paths are made relative to.
+    limit : int | None
+        Keep only the first ``limit`` files in order, without sorting the
+        rest of the listing.
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        ``(stem, relative_path)`` pairs sorted by path components.
+    """
+    prefix_len = len(f"{project_path}{os.sep}")
+    found: list[tuple[str, str, str]] = []
+    for dirpath, names in _iter_py_files(source_path):
+        rel_dir = dirpath[prefix_len:]
+        # NUL sorts below every path character, so comparing keys with it
+        # as the separator matches ``sorted(Path.rglob(...))`` ordering
+        sort_dir = rel_dir.replace(os.sep, "\0")
+        found.extend(
+            (f"{sort_dir}\0{name}", name[:-3], f"{rel_dir}{os.sep}{name}")
+            for name in names
+        )
+    if limit is None:
+        found.sort()
+    else:
+        found = heapq.nsmallest(limit, found)
+    return [(stem, rel_path) for _, stem, rel_path in found]
+
+
+def clear_config_cache() -> None:
+    """Drop all cached pyproject.toml and text file reads.
+
+    Entries are invalidated automatically when a file's mtime or size
+    changes; this hook exists for callers (and tests) that need a
+    guaranteed cold read.
+    """
+    _PYPROJECT_CACHE.clear()
+    _TEXT_CACHE.clear()
+
+
+def _table(data: dict[str, t.Any], *keys: str) -> dict[str, t.Any]:
+    """Walk nested TOML tables, returning ``{}`` for missing or non-table keys.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+        Parsed TOML document or table.
+    *keys : str
+        Table names to descend through.
+
+    Returns
+    -------
+    dict[str, Any]
+        The nested table, or an empty dict.
+    """
+    for key in keys:
+        value = data.get(key)
+        if not isinstance(value, dict):
+            return {}
+        data = value
+    return data
+
 
 def analyze_project_config(project: TargetProject) -> ProjectConfig:
     """Read and parse a target project's pyproject.toml.
@@ -49,44 +194,32 @@ def analyze_project_config(project: TargetProject) -> ProjectConfig:
     project_path = get_project_path(project)
     pyproject_path = project_path / "pyproject.toml"
 
-    if not pyproject_path.exists():
+    try:
+        data = _load_pyproject(pyproject_path)
+    except FileNotFoundError:
         msg = f"pyproject.toml not found at {pyproject_path}"
-        raise FileNotFoundError(msg)
-
-    with pyproject_path.open("rb") as f:
-        data = tomllib.load(f)
+        raise FileNotFoundError(msg) from None
 
-    project_section = data.get("project", {})
-    tool_section = data.get("tool", {})
+    project_section = _table(data, "project")
+    tool_section = _table(data, "tool")
     # pytest config may be under [tool.pytest.ini_options] or [tool.pytest]
-    pytest_section = tool_section.get("pytest", {})
+    pytest_section = _table(tool_section, "pytest")
     if "ini_options" in pytest_section:
-        pytest_section = pytest_section["ini_options"]
-    mypy_section = tool_section.get("mypy", {})
-    ruff_section = tool_section.get("ruff", {})
+        pytest_section = _table(pytest_section, "ini_options")
 
     addopts = pytest_section.get("addopts", [])
     if isinstance(addopts, str):
         addopts = addopts.split()
     has_doctest = any("--doctest-modules" in opt for opt in addopts)
 
-    python_version = project_section.get("requires-python", ">=3.10")
-
-    source_dirs = list(
-        dict.fromkeys(
-            d
-            for category_dirs in _SOURCE_DIRS.values()
-            for d in category_dirs
-            if (project_path / d).is_dir()
-        )
-    )
+    source_dirs = [d for d in _ALL_SOURCE_DIRS if (project_path / d).is_dir()]
 
     return ProjectConfig(
         name=project_section.get("name", project.value),
-        python_version=python_version,
+        python_version=project_section.get("requires-python", ">=3.10"),
         has_doctest_modules=has_doctest,
-        mypy_strict=mypy_section.get("strict", False),
-        ruff_target_version=ruff_section.get("target-version", "py310"),
+        mypy_strict=_table(tool_section, "mypy").get("strict", False),
+        ruff_target_version=_table(tool_section, "ruff").get("target-version", "py310"),
         source_dirs=source_dirs,
     )
 
@@ -109,25 +242,23 @@ def analyze_existing_lessons(
     """
     project_path = get_project_path(project)
     lessons: list[dict[str, str]] = []
-    category = PROJECT_CATEGORIES.get(project, TemplateCategory.LESSON_BASED)
 
-    for src_dir in _SOURCE_DIRS.get(category, ["src"]):
+    for src_dir in _PROJECT_SOURCE_DIRS[project]:
         source_path = project_path / src_dir
         if not source_path.is_dir():
             continue
-        for py_file in sorted(source_path.rglob("*.py")):
-            if py_file.name.startswith("__"):
-                continue
-            lessons.append(
-                {
-                    "name": py_file.stem,
-                    "path": str(py_file.relative_to(project_path)),
-                }
-            )
+        lessons.extend(
+            {"name": stem, "path": rel_path}
+            for stem, rel_path in _walk_py_files(source_path, project_path)
+        )
 
     return lessons
 
 
+#: Upper bound on example lesson paths included in a template.
+_MAX_EXAMPLE_LESSONS = 3
+
+
 def extract_template_patterns(project: TargetProject) -> LessonTemplate:
     """Read template files from a project's notes directory.
 
@@ -144,30 +275,32 @@ def extract_template_patterns(project: TargetProject) -> LessonTemplate:
     project_path = get_project_path(project)
     template = LessonTemplate(project=project)
 
-    # Read lesson template
-    template_path = project_path / "notes" / "lesson_template.py"
-    if template_path.exists():
-        template.template_content = template_path.read_text(encoding="utf-8")
-
-    # Read AGENTS.md for conventions
-    agents_path = project_path / "AGENTS.md"
-    if agents_path.exists():
-        template.conventions = agents_path.read_text(encoding="utf-8")
+    template.template_content = _read_optional_text(
+        project_path / "notes" / "lesson_template.py"
+    )
+    template.conventions = _read_optional_text(project_path / "AGENTS.md")
 
-    # Collect example lesson paths
-    category = PROJECT_CATEGORIES.get(project, TemplateCategory.LESSON_BASED)
-    for src_dir in _SOURCE_DIRS.get(category, ["src"]):
+    # Collect example lesson paths, stopping once enough are found
+    for src_dir in _PROJECT_SOURCE_DIRS[project]:
+        remaining = _MAX_EXAMPLE_LESSONS - len(template.example_lessons)
+        if remaining <= 0:
+            break
         source_path = project_path / src_dir
         if source_path.is_dir():
-            for py_file in sorted(source_path.rglob("*.py"))[:3]:
-                if not py_file.name.startswith("__"):
-                    template.example_lessons.append(
-                        str(py_file.relative_to(project_path)),
-                    )
+            template.example_lessons.extend(
+                rel_path
+                for _, rel_path in _walk_py_files(
+                    source_path, project_path, limit=remaining
+                )
+            )
 
     return template
 
 
+#: File suffixes recognised as progression plans.
+_PROGRESSION_SUFFIXES: tuple[str, ...] = (".md", ".txt")
+
+
 def read_progression(project: TargetProject) -> str:
     """Read progression plan files from a project's notes directory.
 
@@ -190,17 +323,55 @@ def read_progression(project: TargetProject) -> str:
     if not notes_path.is_dir():
         return ""
 
-    parts: list[str] = [
-        path.read_text(encoding="utf-8")
-        for pattern in ["progression*.md", "progression*.txt"]
-        for path in sorted(notes_path.glob(pattern))
-    ]
+    with os.scandir(notes_path) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.startswith("progression")
+            and entry.name.endswith(_PROGRESSION_SUFFIXES)
+            and entry.is_file()
+        ]
+    # All .md plans first, then .txt, each alphabetically
+    names.sort(key=lambda name: (name.endswith(".txt"), name))
+
+    parts = [_read_optional_text(notes_path / name) for name in names]
 
     return "\n\n".join(parts)
 
 
-# Regex to extract a leading numeric prefix from lesson filenames.
-_LESSON_NUMBER_RE = re.compile(r"^(\d+)")
+def _leading_number(name: str) -> int:
+    """Return the leading decimal prefix of a lesson name, or ``0`` if absent."""
+    end = 0
+    while end < len(name) and name[end].isdecimal():
+        end += 1
+    return int(name[:end]) if end else 0
+
+
+def _scan_numbered_lessons(source_path: pathlib.Path) -> int:
+    """Return the highest numeric lesson prefix found under a directory.
+
+    Shares :func:`_iter_py_files` with :func:`analyze_existing_lessons`, so
+    nested lesson directories (DSA keeps them under ``src/algorithms``) are
+    included and missing or unreadable directories are skipped the same way.
+
+    Parameters
+    ----------
+    source_path : pathlib.Path
+        Directory to scan.  Missing directories yield ``0``.
+
+    Returns
+    -------
+    int
+        The largest leading number among ``.py`` files, or ``0``.
+    """
+    return max(
+        (
+            _leading_number(name)
+            for _, names in _iter_py_files(source_path)
+            for name in names
+        ),
+        default=0,
+    )
 
 
 def next_lesson_number(project: TargetProject) -> int:
@@ -220,12 +391,14 @@ def next_lesson_number(project: TargetProject) -> int:
     int
         The next available lesson number.
     """
-    lessons = analyze_existing_lessons(project)
-    max_num = 0
-    for lesson in lessons:
-        match = _LESSON_NUMBER_RE.match(lesson["name"])
-        if match:
-            max_num = max(max_num, int(match.group(1)))
+    project_path = get_project_path(project)
+    max_num = max(
+        (
+            _scan_numbered_lessons(project_path / src_dir)
+            for src_dir in _PROJECT_SOURCE_DIRS[project]
+        ),
+        default=0,
+    )
     return max_num + 1
 
 
@@ -268,14 +441,15 @@ def read_source_file(file_path: pathlib.Path) -> str:
     Returns
     -------
     str
-        File contents as text.
+        File contents as text.  Unchanged files are served from memory.
 
     Raises
     ------
     FileNotFoundError
         If the file does not exist.
     """
-    if not file_path.exists():
+    try:
+        return _read_text_cached(file_path)
+    except FileNotFoundError:
         msg = f"File not found: {file_path}"
-        raise FileNotFoundError(msg)
-    return file_path.read_text(encoding="utf-8")
+        raise FileNotFoundError(msg) from None
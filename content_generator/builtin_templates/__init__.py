@@ -1,12 +1,13 @@
 """Built-in lesson templates for fallback when projects lack templates.
 
 Ships ``.py.tmpl`` reference files loaded via :mod:`importlib.resources`.
-These are reference templates for the LLM (not Jinja2 templates) and
-coexist with the Jinja2 rendering in :mod:`content_generator.templates`.
+These are reference templates for the LLM (not render templates) and
+coexist with the boilerplate rendering in :mod:`content_generator.templates`.
 """
 
 from __future__ import annotations
 
+import functools
 import importlib.resources
 
 from ..models import PedagogyStyle
@@ -31,7 +32,12 @@ def get_builtin_template(style: PedagogyStyle) -> str:
     str
         Template content as a string.
     """
-    filename = _TEMPLATE_MAP[style]
+    return _read_template(_TEMPLATE_MAP[style])
+
+
+@functools.cache
+def _read_template(filename: str) -> str:
+    """Read a packaged template once; the files are immutable at runtime."""
     ref = importlib.resources.files("content_generator.builtin_templates").joinpath(
         filename
     )
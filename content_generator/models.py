@@ -9,7 +9,7 @@ from __future__ import annotations
 import enum
 import pathlib
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TargetProject(enum.StrEnum):
@@ -172,6 +172,8 @@ class LessonPlan(BaseModel):
         Teaching narrative connecting concepts.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: str
     topic: str
     lesson_number: int = 1
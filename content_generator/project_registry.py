@@ -2,32 +2,94 @@
 
 Provides path resolution and traversal safety for all file operations
 targeting learning project directories.
+
+Paths are resolved from ``CONTENT_GENERATOR_STUDY_BASE`` on first use and
+kept until :func:`clear_registry_cache` is called. ``PROJECT_PATHS`` and
+``ALLOWED_ROOTS`` are read-only views of that state; to point the registry
+elsewhere, change the environment variable and clear the cache.
 """
 
 from __future__ import annotations
 
+import collections.abc
+import functools
 import os
 import pathlib
+import typing as t
 
 from .models import TargetProject
 
-#: Base directory containing all learning projects.
-_STUDY_BASE = pathlib.Path(
-    os.environ.get(
-        "CONTENT_GENERATOR_STUDY_BASE", str(pathlib.Path.home() / "study" / "python")
+if t.TYPE_CHECKING:
+    #: Base directory containing all learning projects.
+    _STUDY_BASE: pathlib.Path
+
+    #: Maps each target project to its root directory.
+    PROJECT_PATHS: dict[TargetProject, pathlib.Path]
+
+    #: Roots allowed for file write operations.
+    ALLOWED_ROOTS: frozenset[pathlib.Path]
+
+#: Project directory names under the study base.
+_PROJECT_DIRS: dict[TargetProject, str] = {
+    TargetProject.DSA: "learning-dsa",
+    TargetProject.ASYNCIO: "learning-asyncio",
+    TargetProject.LITESTAR: "learning-litestar",
+    TargetProject.FASTAPI: "learning-fastapi",
+}
+
+
+def _study_base() -> pathlib.Path:
+    """Resolve the study base directory from the environment."""
+    return pathlib.Path(
+        os.environ.get(
+            "CONTENT_GENERATOR_STUDY_BASE",
+            str(pathlib.Path.home() / "study" / "python"),
+        )
     )
-)
-
-#: Maps each target project to its root directory.
-PROJECT_PATHS: dict[TargetProject, pathlib.Path] = {
-    TargetProject.DSA: _STUDY_BASE / "learning-dsa",
-    TargetProject.ASYNCIO: _STUDY_BASE / "learning-asyncio",
-    TargetProject.LITESTAR: _STUDY_BASE / "learning-litestar",
-    TargetProject.FASTAPI: _STUDY_BASE / "learning-fastapi",
+
+
+@functools.cache
+def _project_paths() -> dict[TargetProject, pathlib.Path]:
+    """Build the project path map on first use."""
+    base = _study_base()
+    return {project: base / name for project, name in _PROJECT_DIRS.items()}
+
+
+def _allowed_roots() -> frozenset[pathlib.Path]:
+    """Collect the allowed write roots."""
+    return frozenset(_project_paths().values())
+
+
+def _allowed_prefixes() -> tuple[frozenset[str], tuple[str, ...]]:
+    """Return root strings and separator-terminated prefixes.
+
+    The trailing separator keeps ``learning-dsa-x`` from matching
+    ``learning-dsa``.
+    """
+    root_strs = frozenset(str(root) for root in _allowed_roots())
+    return root_strs, tuple(f"{root}{os.sep}" for root in root_strs)
+
+
+def clear_registry_cache() -> None:
+    """Forget resolved project paths so the next lookup re-reads the environment."""
+    _project_paths.cache_clear()
+
+
+_LAZY_ATTRS: dict[str, collections.abc.Callable[[], object]] = {
+    "_STUDY_BASE": _study_base,
+    "PROJECT_PATHS": _project_paths,
+    "ALLOWED_ROOTS": _allowed_roots,
 }
 
-#: Roots allowed for file write operations.
-ALLOWED_ROOTS: frozenset[pathlib.Path] = frozenset(PROJECT_PATHS.values())
+
+def __getattr__(name: str) -> object:
+    """Resolve registry constants lazily so importing skips ``Path.home()``."""
+    try:
+        factory = _LAZY_ATTRS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    return factory()
 
 
 def get_project_path(project: TargetProject) -> pathlib.Path:
@@ -48,7 +110,7 @@ def get_project_path(project: TargetProject) -> pathlib.Path:
     KeyError
         If the project is not registered.
     """
-    return PROJECT_PATHS[project]
+    return _project_paths()[project]
 
 
 def validate_path(path: pathlib.Path) -> pathlib.Path:
@@ -72,7 +134,9 @@ def validate_path(path: pathlib.Path) -> pathlib.Path:
         If the path is not within any allowed root.
     """
     resolved = path.resolve()
-    if any(resolved.is_relative_to(root) for root in ALLOWED_ROOTS):
+    resolved_str = str(resolved)
+    root_strs, prefixes = _allowed_prefixes()
+    if resolved_str in root_strs or resolved_str.startswith(prefixes):
         return resolved
     msg = f"Path {resolved} is not within any allowed project root"
     raise ValueError(msg)
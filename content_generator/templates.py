@@ -1,19 +1,30 @@
-"""Jinja2 boilerplate scaffolding for generated content.
+"""Boilerplate scaffolding for generated content.
 
 Provides templates that handle structural boilerplate (imports, guards,
-docstring skeleton) while the LLM fills semantic content.
+docstring skeleton) while the LLM fills semantic content.  Templates are
+written with Jinja-style ``{{ name }}`` placeholders but contain no logic,
+so they are converted to ``str.format`` strings once at import and rendered
+without a template engine.
 """
 
 from __future__ import annotations
 
-import jinja2
+import re
+
+#: Matches a ``{{ name }}`` placeholder or any other literal brace.
+_PLACEHOLDER_RE = re.compile(r"\{\{ (\w+) \}\}|([{}])")
+
+
+def _to_format_string(template: str) -> str:
+    """Convert ``{{ name }}`` placeholders to ``str.format`` fields.
+
+    Literal braces are doubled so they survive formatting unchanged.
+    """
+    return _PLACEHOLDER_RE.sub(
+        lambda m: f"{{{m[1]}}}" if m[1] else m[2] * 2,
+        template,
+    )
 
-#: Jinja2 environment for rendering templates.
-_ENV = jinja2.Environment(
-    autoescape=False,  # Generating Python source code, not HTML
-    keep_trailing_newline=True,
-    undefined=jinja2.StrictUndefined,
-)
 
 #: Template for lesson-based content (DSA, asyncio).
 LESSON_TEMPLATE_STR = '''\
@@ -90,10 +101,10 @@ from __future__ import annotations
 {{ body }}
 '''
 
-_LESSON_TEMPLATE = _ENV.from_string(LESSON_TEMPLATE_STR)
-_ASYNCIO_LESSON_TEMPLATE = _ENV.from_string(ASYNCIO_LESSON_TEMPLATE_STR)
-_APP_TEMPLATE = _ENV.from_string(APP_TEMPLATE_STR)
-_APP_TEST_TEMPLATE = _ENV.from_string(APP_TEST_TEMPLATE_STR)
+_LESSON_TEMPLATE = _to_format_string(LESSON_TEMPLATE_STR)
+_ASYNCIO_LESSON_TEMPLATE = _to_format_string(ASYNCIO_LESSON_TEMPLATE_STR)
+_APP_TEMPLATE = _to_format_string(APP_TEMPLATE_STR)
+_APP_TEST_TEMPLATE = _to_format_string(APP_TEST_TEMPLATE_STR)
 
 
 def render_lesson_template(
@@ -124,7 +135,7 @@ def render_lesson_template(
     str
         Rendered Python source code.
     """
-    return _LESSON_TEMPLATE.render(
+    return _LESSON_TEMPLATE.format(
         module_docstring=module_docstring,
         imports=imports,
         body=body,
@@ -161,7 +172,7 @@ def render_asyncio_lesson_template(
     str
         Rendered Python source code.
     """
-    return _ASYNCIO_LESSON_TEMPLATE.render(
+    return _ASYNCIO_LESSON_TEMPLATE.format(
         module_docstring=module_docstring,
         imports=imports,
         body=body,
@@ -192,7 +203,7 @@ def render_app_template(
     str
         Rendered Python source code.
     """
-    return _APP_TEMPLATE.render(
+    return _APP_TEMPLATE.format(
         module_docstring=module_docstring,
         imports=imports,
         body=body,
@@ -221,7 +232,7 @@ def render_app_test_template(
     str
         Rendered Python source code.
     """
-    return _APP_TEST_TEMPLATE.render(
+    return _APP_TEST_TEMPLATE.format(
         module_docstring=module_docstring,
         imports=imports,
         body=body,
@@ -7,12 +7,72 @@ for reliable serialization back to the LLM agent.
 
 from __future__ import annotations
 
+import collections.abc
+import pathlib
+
 from google.adk.agents import Context
 
 from . import analyzers, domains, validators
 from .models import PROJECT_CATEGORIES, TargetProject, TemplateCategory
 from .project_registry import get_project_path, validate_path
 
+#: Target projects keyed by their string value, for direct lookup.
+_PROJECTS: dict[str, TargetProject] = {
+    project.value: project for project in TargetProject
+}
+
+#: LESSON_BASED projects, whose lessons carry doctests as primary tests.
+_DOCTEST_PROJECTS: frozenset[TargetProject] = frozenset(
+    project
+    for project in TargetProject
+    if PROJECT_CATEGORIES.get(project, TemplateCategory.LESSON_BASED)
+    == TemplateCategory.LESSON_BASED
+)
+
+
+def _resolve_project(project_name: str) -> TargetProject:
+    """Map a tool's ``project_name`` argument to its :class:`TargetProject`.
+
+    Raises
+    ------
+    ValueError
+        If ``project_name`` is not a known project, as ``TargetProject(...)``
+        would.
+    """
+    try:
+        return _PROJECTS[project_name]
+    except KeyError:
+        return TargetProject(project_name)
+
+
+def _project_file(
+    project_name: str,
+    relative_path: str,
+) -> tuple[TargetProject, pathlib.Path, pathlib.Path]:
+    """Resolve a tool's project and file arguments in one place.
+
+    Parameters
+    ----------
+    project_name : str
+        A :class:`TargetProject` value.
+    relative_path : str
+        Path relative to the project root.
+
+    Returns
+    -------
+    tuple[TargetProject, pathlib.Path, pathlib.Path]
+        The project, its root directory, and the validated absolute file
+        path.
+
+    Raises
+    ------
+    ValueError
+        If the project is unknown or the path escapes the allowed roots.
+    """
+    project = _resolve_project(project_name)
+    project_path = get_project_path(project)
+    return project, project_path, validate_path(project_path / relative_path)
+
 
 def analyze_target_project(project_name: str) -> str:
     """Analyze a target project's configuration and conventions.
@@ -31,7 +91,7 @@ def analyze_target_project(project_name: str) -> str:
     str
         Formatted analysis of project configuration.
     """
-    project = TargetProject(project_name)
+    project = _resolve_project(project_name)
     config = analyzers.analyze_project_config(project)
     return (
         f"Project: {config.name}\n"
@@ -57,12 +117,16 @@ def get_existing_content(project_name: str) -> str:
     str
         Formatted list of existing lessons with paths.
     """
-    project = TargetProject(project_name)
+    project = _resolve_project(project_name)
     lessons = analyzers.analyze_existing_lessons(project)
     if not lessons:
         return "No existing lessons found."
-    lines = [f"- {lesson['name']} ({lesson['path']})" for lesson in lessons]
-    return f"Found {len(lessons)} existing files:\n" + "\n".join(lines)
+    return "\n".join(
+        [
+            f"Found {len(lessons)} existing files:",
+            *(f"- {lesson['name']} ({lesson['path']})" for lesson in lessons),
+        ]
+    )
 
 
 def read_template(project_name: str) -> str:
@@ -79,7 +143,7 @@ def read_template(project_name: str) -> str:
     str
         Template content and project conventions.
     """
-    project = TargetProject(project_name)
+    project = _resolve_project(project_name)
     template = analyzers.extract_template_patterns(project)
     parts = []
     if template.template_content:
@@ -107,7 +171,7 @@ def read_progression_plan(project_name: str) -> str:
     str
         Combined progression plan text.
     """
-    project = TargetProject(project_name)
+    project = _resolve_project(project_name)
     text = analyzers.read_progression(project)
     return text if text else "No progression plan found."
 
@@ -128,10 +192,7 @@ def read_source_reference(project_name: str, relative_path: str) -> str:
     str
         File contents.
     """
-    project = TargetProject(project_name)
-    project_path = get_project_path(project)
-    file_path = project_path / relative_path
-    validate_path(file_path)
+    _, _, file_path = _project_file(project_name, relative_path)
     return analyzers.read_source_file(file_path)
 
 
@@ -158,29 +219,43 @@ def write_generated_file(
     Returns
     -------
     str
-        Success or error message.
+        Success message, or a no-change notice when the file already
+        holds exactly ``content``.
     """
-    project = TargetProject(project_name)
-    project_path = get_project_path(project)
-    file_path = project_path / relative_path
-    validated_path = validate_path(file_path)
+    _, _, validated_path = _project_file(project_name, relative_path)
+    data = content.encode("utf-8")
 
-    validated_path.parent.mkdir(parents=True, exist_ok=True)
-    validated_path.write_text(content, encoding="utf-8")
+    # Repair cycles often resubmit identical code; leaving the file alone
+    # keeps ruff/mypy caches keyed on its mtime warm
+    try:
+        unchanged = validated_path.read_bytes() == data
+    except FileNotFoundError:
+        unchanged = False
+
+    if not unchanged:
+        validated_path.parent.mkdir(parents=True, exist_ok=True)
+        validated_path.write_bytes(data)
 
     # Store the written file path in session state for the validator
     tool_context.state["last_written_file"] = str(validated_path)
     tool_context.state["last_written_project"] = project_name
 
+    if unchanged:
+        return f"No change (content identical): {relative_path}"
     return f"Successfully wrote {len(content)} bytes to {relative_path}"
 
 
 def validate_generated_content(
     project_name: str,
     relative_path: str,
+    tool_context: Context,
 ) -> str:
     """Run full validation (ruff, mypy, pytest) on a generated file.
 
+    On a pass the tool ends the enclosing validation loop itself, the way
+    ``exit_loop`` does: the validator still writes its final report, but
+    the loop does not start another iteration.
+
     Parameters
     ----------
     project_name : str
@@ -188,25 +263,24 @@ def validate_generated_content(
         learning-fastapi.
     relative_path : str
         Path relative to the project root.
+    tool_context : Context
+        ADK context; a pass sets ``actions.escalate``.
 
     Returns
     -------
     str
         PASS if all checks pass, or detailed error messages.
     """
-    project = TargetProject(project_name)
-    project_path = get_project_path(project)
-    file_path = project_path / relative_path
-    validate_path(file_path)
+    project, project_path, file_path = _project_file(project_name, relative_path)
 
-    category = PROJECT_CATEGORIES.get(project, TemplateCategory.LESSON_BASED)
-    run_doctest = category == TemplateCategory.LESSON_BASED
+    run_doctest = project in _DOCTEST_PROJECTS
 
     result = validators.validate_file(
         file_path, project_dir=project_path, run_doctest=run_doctest
     )
 
     if result.passed:
+        tool_context.actions.escalate = True
         return "PASS: All validation checks passed."
 
     sections = [
@@ -275,11 +349,42 @@ def get_next_lesson_number(project_name: str) -> str:
     str
         The next available lesson number.
     """
-    project = TargetProject(project_name)
+    project = _resolve_project(project_name)
     number = analyzers.next_lesson_number(project)
     return f"Next lesson number: {number}"
 
 
+def gather_project_context(project_name: str) -> str:
+    """Collect everything needed to analyze a target project in one call.
+
+    Runs :func:`analyze_target_project`, :func:`get_existing_content`,
+    :func:`get_next_lesson_number`, :func:`read_template`, and
+    :func:`read_progression_plan` in order and combines their output, so
+    the model needs one tool call instead of five.
+
+    Parameters
+    ----------
+    project_name : str
+        One of: learning-dsa, learning-asyncio, learning-litestar,
+        learning-fastapi.
+
+    Returns
+    -------
+    str
+        One section per underlying tool, in a fixed order.
+    """
+    sections: list[tuple[str, collections.abc.Callable[[str], str]]] = [
+        ("PROJECT CONFIGURATION", analyze_target_project),
+        ("EXISTING CONTENT", get_existing_content),
+        ("NEXT LESSON", get_next_lesson_number),
+        ("TEMPLATE AND CONVENTIONS", read_template),
+        ("PROGRESSION PLAN", read_progression_plan),
+    ]
+    return "\n\n".join(
+        f"##### {title} #####\n{tool(project_name)}" for title, tool in sections
+    )
+
+
 def run_ruff_format(project_name: str, relative_path: str) -> str:
     """Run ruff format --check on a generated file.
 
@@ -296,10 +401,7 @@ def run_ruff_format(project_name: str, relative_path: str) -> str:
     str
         PASS or error output.
     """
-    project = TargetProject(project_name)
-    project_path = get_project_path(project)
-    file_path = project_path / relative_path
-    validate_path(file_path)
+    _, project_path, file_path = _project_file(project_name, relative_path)
 
     ok, output = validators.run_ruff_format(file_path, project_dir=project_path)
     return f"PASS: {output}" if ok else f"FAIL: {output}"
@@ -321,10 +423,7 @@ def run_ruff_check(project_name: str, relative_path: str) -> str:
     str
         PASS or error output.
     """
-    project = TargetProject(project_name)
-    project_path = get_project_path(project)
-    file_path = project_path / relative_path
-    validate_path(file_path)
+    _, project_path, file_path = _project_file(project_name, relative_path)
 
     ok, output = validators.run_ruff_check(file_path, project_dir=project_path)
     return f"PASS: {output}" if ok else f"FAIL: {output}"
@@ -346,10 +445,7 @@ def run_mypy_check(project_name: str, relative_path: str) -> str:
     str
         PASS or error output.
     """
-    project = TargetProject(project_name)
-    project_path = get_project_path(project)
-    file_path = project_path / relative_path
-    validate_path(file_path)
+    _, project_path, file_path = _project_file(project_name, relative_path)
 
     ok, output = validators.run_mypy_check(file_path, project_dir=project_path)
     return f"PASS: {output}" if ok else f"FAIL: {output}"
@@ -371,10 +467,7 @@ def run_pytest_doctest(project_name: str, relative_path: str) -> str:
     str
         PASS or error output.
     """
-    project = TargetProject(project_name)
-    project_path = get_project_path(project)
-    file_path = project_path / relative_path
-    validate_path(file_path)
+    _, project_path, file_path = _project_file(project_name, relative_path)
 
     ok, output = validators.run_pytest_doctest(file_path, project_dir=project_path)
     return f"PASS: {output}" if ok else f"FAIL: {output}"
@@ -8,11 +8,13 @@ from __future__ import annotations
 
 import re
 
-# Compiled regexes for stripping markdown code fences from LLM output.
-# Both must match for stripping to occur — prevents false positives from
-# backticks inside docstrings or inline code.
-_OPENING_FENCE_RE = re.compile(r"^`{3,}[^\S\n]*\w*[^\S\n]*\n", re.ASCII)
-_CLOSING_FENCE_RE = re.compile(r"\n[^\S\n]*`{3,}[^\S\n]*$", re.ASCII)
+#: Matches a whole fenced block: opening fence with optional language tag,
+#: body, and closing fence on its own line.  Requiring both fences prevents
+#: false positives from backticks inside docstrings or inline code.
+_FENCED_RE = re.compile(
+    r"\A`{3,}[^\S\n]*\w*[^\S\n]*\n(?:(.*)\n)?[^\S\n]*`{3,}[^\S\n]*\Z",
+    re.ASCII | re.DOTALL,
+)
 
 
 def strip_code_fences(text: str) -> str:
@@ -33,7 +35,9 @@ def strip_code_fences(text: str) -> str:
         Code with outer fences removed (if matched) and whitespace trimmed.
     """
     stripped = text.strip()
-    if _OPENING_FENCE_RE.search(stripped) and _CLOSING_FENCE_RE.search(stripped):
-        stripped = _OPENING_FENCE_RE.sub("", stripped, count=1)
-        stripped = _CLOSING_FENCE_RE.sub("", stripped, count=1)
-    return stripped.strip()
+    if not stripped.startswith("```"):
+        return stripped
+    match = _FENCED_RE.match(stripped)
+    if match is None:
+        return stripped
+    return (match[1] or "").strip()
@@ -6,6 +6,8 @@ directories, returning structured validation results.
 
 from __future__ import annotations
 
+import collections.abc
+import concurrent.futures
 import pathlib
 import subprocess
 
@@ -32,12 +34,14 @@ def _run_tool(
     Returns
     -------
     tuple[bool, str]
-        Tuple of (success, combined stdout+stderr output).
+        Tuple of (success, output). stderr is merged into stdout by the OS,
+        so messages keep the order the tool wrote them in.
     """
     try:
         result = subprocess.run(
             args,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
             cwd=cwd,
             timeout=timeout,
@@ -48,8 +52,7 @@ def _run_tool(
     except FileNotFoundError:
         return False, f"Command not found: {args[0]}"
     else:
-        output = (result.stdout + result.stderr).strip()
-        return result.returncode == 0, output
+        return result.returncode == 0, result.stdout.strip()
 
 
 def run_ruff_format(
@@ -85,6 +88,11 @@ def run_ruff_check(
 ) -> tuple[bool, str]:
     """Run ``ruff check`` on a file.
 
+    Diagnostics use the concise one-line format: the output is read by the
+    validator model, which already has the file, so ruff's source excerpts
+    only add tokens. ``--no-fix`` keeps a project-level ``fix = true`` from
+    rewriting the file during validation.
+
     Parameters
     ----------
     file_path : pathlib.Path
@@ -99,7 +107,15 @@ def run_ruff_check(
     """
     cwd = project_dir or file_path.parent
     return _run_tool(
-        ["uv", "run", "ruff", "check", str(file_path)],
+        [
+            "uv",
+            "run",
+            "ruff",
+            "check",
+            "--no-fix",
+            "--output-format=concise",
+            str(file_path),
+        ],
         cwd=cwd,
     )
 
@@ -137,6 +153,10 @@ def run_pytest_doctest(
 ) -> tuple[bool, str]:
     """Run ``pytest --doctest-modules`` on a file.
 
+    The cache provider is disabled: a one-file doctest run gains nothing
+    from ``--lf`` bookkeeping, and it would leave ``.pytest_cache`` behind
+    in the target project on every validation.
+
     Parameters
     ----------
     file_path : pathlib.Path
@@ -151,7 +171,16 @@ def run_pytest_doctest(
     """
     cwd = project_dir or file_path.parent
     return _run_tool(
-        ["uv", "run", "pytest", "--doctest-modules", str(file_path)],
+        [
+            "uv",
+            "run",
+            "pytest",
+            "--doctest-modules",
+            "--no-header",
+            "-p",
+            "no:cacheprovider",
+            str(file_path),
+        ],
         cwd=cwd,
     )
 
@@ -164,8 +193,9 @@ def validate_file(
 ) -> ValidationResult:
     """Run all validation checks on a file.
 
-    Runs ruff format, ruff check, and mypy sequentially. Optionally runs
-    pytest --doctest-modules (skipped for APP_BASED projects).
+    Runs ruff format, ruff check, and mypy concurrently, since each is an
+    independent subprocess. Optionally runs pytest --doctest-modules
+    alongside them (skipped for APP_BASED projects).
 
     Parameters
     ----------
@@ -185,14 +215,20 @@ def validate_file(
     """
     cwd = project_dir or file_path.parent
 
-    fmt_ok, fmt_out = run_ruff_format(file_path, project_dir=cwd)
-    lint_ok, lint_out = run_ruff_check(file_path, project_dir=cwd)
-    mypy_ok, mypy_out = run_mypy_check(file_path, project_dir=cwd)
-
+    checks: list[collections.abc.Callable[..., tuple[bool, str]]] = [
+        run_ruff_format,
+        run_ruff_check,
+        run_mypy_check,
+    ]
     if run_doctest:
-        test_ok, test_out = run_pytest_doctest(file_path, project_dir=cwd)
-    else:
-        test_ok, test_out = True, ""
+        checks.append(run_pytest_doctest)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        futures = [pool.submit(check, file_path, project_dir=cwd) for check in checks]
+        results = [future.result() for future in futures]
+
+    (fmt_ok, fmt_out), (lint_ok, lint_out), (mypy_ok, mypy_out) = results[:3]
+    test_ok, test_out = results[3] if run_doctest else (True, "")
 
     return ValidationResult(
         passed=all([fmt_ok, lint_ok, mypy_ok, test_ok]),
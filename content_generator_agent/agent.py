@@ -1,7 +1,8 @@
 """Agent definition for the Content Generator SequentialAgent pipeline.
 
-Orchestrates a 4-stage pipeline: template analysis, content planning,
-code generation, and validation with structural retry via LoopAgent.
+Orchestrates a 5-stage pipeline: project context prefetch, template
+analysis, content planning, code generation, and validation with
+structural retry via LoopAgent.
 """
 
 from __future__ import annotations
@@ -11,11 +12,8 @@ from google.adk.tools.exit_loop_tool import exit_loop
 from google.genai import types
 
 from content_generator.tools import (
-    analyze_target_project,
-    get_existing_content,
-    read_progression_plan,
+    gather_project_context,
     read_source_reference,
-    read_template,
     run_mypy_check,
     run_pytest_doctest,
     run_ruff_check,
@@ -25,6 +23,8 @@ from content_generator.tools import (
 )
 from content_generator.utils import strip_code_fences
 
+from .llm_cache import forget_pending_request, store_response, use_cached_response
+from .prefetch import ProjectContextPrefetcher
 from .prompts import (
     CODE_GENERATOR_INSTRUCTION,
     CONTENT_PLANNER_INSTRUCTION,
@@ -32,21 +32,28 @@ from .prompts import (
     VALIDATOR_INSTRUCTION,
 )
 
+#: Generation config for deterministic agents.  ADK deep-copies an agent's
+#: config into each request, so agents can share one instance.
+_DETERMINISTIC_CONFIG = types.GenerateContentConfig(temperature=0.0)
+
+project_prefetcher = ProjectContextPrefetcher(
+    name="project_prefetcher",
+    description="Gathers project context before the template analyzer runs.",
+)
+
 template_analyzer = Agent(
     name="template_analyzer",
     model="gemini-2.5-flash-lite",
     instruction=TEMPLATE_ANALYZER_INSTRUCTION,
-    tools=[
-        analyze_target_project,
-        get_existing_content,
-        read_template,
-        read_progression_plan,
-    ],
+    tools=[gather_project_context],
     output_key="template_analysis",
     include_contents="default",
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
-    generate_content_config=types.GenerateContentConfig(temperature=0.0),
+    generate_content_config=_DETERMINISTIC_CONFIG,
+    before_model_callback=use_cached_response,
+    after_model_callback=store_response,
+    on_model_error_callback=forget_pending_request,
 )
 
 content_planner = Agent(
@@ -89,7 +96,7 @@ validator = Agent(
     include_contents="none",
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
-    generate_content_config=types.GenerateContentConfig(temperature=0.0),
+    generate_content_config=_DETERMINISTIC_CONFIG,
 )
 
 validation_loop = LoopAgent(
@@ -100,5 +107,11 @@ validation_loop = LoopAgent(
 
 root_agent = SequentialAgent(
     name="content_generator",
-    sub_agents=[template_analyzer, content_planner, code_generator, validation_loop],
+    sub_agents=[
+        project_prefetcher,
+        template_analyzer,
+        content_planner,
+        code_generator,
+        validation_loop,
+    ],
 )
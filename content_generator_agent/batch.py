@@ -0,0 +1,126 @@
+"""Run the content generator pipeline over many lesson requests at once.
+
+Requests that name different projects run concurrently, bounded by a
+semaphore.  Requests for the same project run one after another, in the
+order given, so each one sees the lessons written before it when it picks
+the next lesson number.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections.abc
+import typing as t
+
+from google.adk.events import Event
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+from pydantic import BaseModel, Field
+
+from .agent import root_agent
+from .prefetch import find_project_name
+
+if t.TYPE_CHECKING:
+    from google.adk.agents import BaseAgent
+
+#: ADK app name used for batch sessions.
+_APP_NAME = "content_generator_batch"
+
+#: User id owning batch sessions.
+_USER_ID = "batch"
+
+
+def _user_message(text: str) -> types.Content:
+    """Wrap request text as a user message."""
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+class BatchResult(BaseModel):
+    """Outcome of one request in a batch run.
+
+    Parameters
+    ----------
+    request : str
+        The user request text.
+    events : list[Event]
+        Every event the pipeline yielded for the request.
+    error : str
+        ``"ExceptionType: message"`` when the pipeline raised, else ``""``.
+        Events yielded before the failure are kept.
+    """
+
+    request: str
+    events: list[Event] = Field(default_factory=list)
+    error: str = ""
+
+    @property
+    def final_text(self) -> str:
+        """Return the text of the last event that carried any."""
+        for event in reversed(self.events):
+            if event.content is not None and event.content.parts:
+                text = "".join(part.text or "" for part in event.content.parts)
+                if text:
+                    return text
+        return ""
+
+
+async def run_batch(
+    requests: collections.abc.Sequence[str],
+    *,
+    agent: BaseAgent | None = None,
+    max_concurrency: int = 4,
+) -> list[BatchResult]:
+    """Run the pipeline once per request, concurrently across projects.
+
+    Parameters
+    ----------
+    requests : collections.abc.Sequence[str]
+        User requests, e.g. ``"Generate a lesson on heaps for learning-dsa"``.
+    agent : BaseAgent | None
+        Agent to run. Defaults to the content generator ``root_agent``.
+    max_concurrency : int
+        Maximum number of pipelines running at the same time.
+
+    Returns
+    -------
+    list[BatchResult]
+        One result per request, in request order. A request whose pipeline
+        raised carries the failure in :attr:`BatchResult.error`; the other
+        requests, including later ones for the same project, still run.
+    """
+    runner = InMemoryRunner(agent=agent or root_agent, app_name=_APP_NAME)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results = [BatchResult(request=request) for request in requests]
+
+    # Requests that name no single project share one serial group, since
+    # they may still target the same project
+    groups: dict[str | None, list[BatchResult]] = {}
+    for result in results:
+        project_name = find_project_name(_user_message(result.request))
+        groups.setdefault(project_name, []).append(result)
+
+    async def run_one(result: BatchResult) -> None:
+        session = await runner.session_service.create_session(
+            app_name=_APP_NAME,
+            user_id=_USER_ID,
+        )
+        try:
+            async for event in runner.run_async(
+                user_id=_USER_ID,
+                session_id=session.id,
+                new_message=_user_message(result.request),
+            ):
+                result.events.append(event)
+        except Exception as exc:
+            # One failing lesson must not discard the rest of the batch
+            result.error = f"{type(exc).__name__}: {exc}"
+
+    async def run_group(group: list[BatchResult]) -> None:
+        for result in group:
+            async with semaphore:
+                await run_one(result)
+
+    async with asyncio.TaskGroup() as task_group:
+        for group in groups.values():
+            task_group.create_task(run_group(group))
+    return results
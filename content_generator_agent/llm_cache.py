@@ -0,0 +1,138 @@
+"""Exact-match response cache for the template analyzer.
+
+A ``before_model_callback`` that returns an :class:`LlmResponse` makes ADK
+skip the model call, so identical requests to a temperature 0 agent are
+answered from memory.  The key covers the model name, the full generation
+config (system instruction, temperature, tool declarations) and every
+content turn, including tool results, so a changed project on disk produces
+a changed tool result and therefore a miss.
+
+Only read-only agents whose every input reaches the request may use it.
+The validator is not cached: it writes files, and with
+``include_contents="none"`` its first request does not show the file on
+disk, so a replayed turn could write stale content.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+
+from google.adk.agents import Context
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+#: Maximum number of cached responses kept before least-recently-used eviction.
+_MAX_ENTRIES = 256
+
+#: Cached responses keyed by request fingerprint, oldest first.
+_RESPONSES: collections.OrderedDict[str, LlmResponse] = collections.OrderedDict()
+
+#: Fingerprints of requests awaiting a model response, keyed by
+#: ``(invocation id, agent name)``.
+_PENDING: dict[tuple[str, str], str] = {}
+
+
+def _request_key(llm_request: LlmRequest) -> str:
+    """Fingerprint everything that determines a temperature 0 response."""
+    digest = hashlib.sha256()
+    digest.update((llm_request.model or "").encode())
+    digest.update(llm_request.config.model_dump_json(exclude_none=True).encode())
+    for content in llm_request.contents:
+        digest.update(content.model_dump_json(exclude_none=True).encode())
+    return digest.hexdigest()
+
+
+def use_cached_response(
+    callback_context: Context,
+    llm_request: LlmRequest,
+) -> LlmResponse | None:
+    """Answer a request from the cache, or remember its key for storing.
+
+    Parameters
+    ----------
+    callback_context : Context
+        ADK callback context for the running agent.
+    llm_request : LlmRequest
+        The request about to be sent to the model.
+
+    Returns
+    -------
+    LlmResponse | None
+        A copy of the cached response, or None to call the model.
+    """
+    key = _request_key(llm_request)
+    cached = _RESPONSES.get(key)
+    if cached is not None:
+        _RESPONSES.move_to_end(key)
+        return cached.model_copy(deep=True)
+    _PENDING[(callback_context.invocation_id, callback_context.agent_name)] = key
+    return None
+
+
+def store_response(
+    callback_context: Context,
+    llm_response: LlmResponse,
+) -> LlmResponse | None:
+    """Cache a complete, successful model response.
+
+    Partial (streamed) chunks and error responses are not cached.
+
+    Parameters
+    ----------
+    callback_context : Context
+        ADK callback context for the running agent.
+    llm_response : LlmResponse
+        The response returned by the model.
+
+    Returns
+    -------
+    None
+        The response is passed through unchanged.
+    """
+    if llm_response.partial:
+        return None
+    key = _PENDING.pop(
+        (callback_context.invocation_id, callback_context.agent_name), None
+    )
+    if key is None or llm_response.error_code or llm_response.content is None:
+        return None
+    _RESPONSES[key] = llm_response.model_copy(deep=True)
+    _RESPONSES.move_to_end(key)
+    while len(_RESPONSES) > _MAX_ENTRIES:
+        _RESPONSES.popitem(last=False)
+    return None
+
+
+def forget_pending_request(
+    callback_context: Context,
+    llm_request: LlmRequest,
+    error: Exception,
+) -> LlmResponse | None:
+    """Drop the pending fingerprint of a model call that raised.
+
+    :func:`store_response` never runs for a failed call, so without this
+    its :data:`_PENDING` entry would outlive the invocation.
+
+    Parameters
+    ----------
+    callback_context : Context
+        ADK callback context for the running agent.
+    llm_request : LlmRequest
+        The request that failed.
+    error : Exception
+        The error raised by the model call.
+
+    Returns
+    -------
+    None
+        The error is propagated unchanged.
+    """
+    _PENDING.pop((callback_context.invocation_id, callback_context.agent_name), None)
+    return None
+
+
+def clear_response_cache() -> None:
+    """Forget every cached response."""
+    _RESPONSES.clear()
+    _PENDING.clear()
@@ -0,0 +1,70 @@
+"""Deterministic prefetch of project context ahead of the template analyzer.
+
+When the user's request names exactly one target project, its context is
+gathered before any model call and stored in session state, so the
+template analyzer can synthesize its analysis without a tool round trip.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections.abc
+import typing as t
+
+from google.adk.agents import BaseAgent
+from google.adk.events import Event, EventActions
+
+from content_generator.models import TargetProject
+from content_generator.tools import gather_project_context
+
+if t.TYPE_CHECKING:
+    from google.adk.agents.invocation_context import InvocationContext
+    from google.genai import types
+
+#: Session state key holding the prefetched project context.
+PROJECT_CONTEXT_KEY = "project_context"
+
+
+def find_project_name(content: types.Content | None) -> str | None:
+    """Return the single target project named in a user message.
+
+    Parameters
+    ----------
+    content : types.Content | None
+        The user's message.
+
+    Returns
+    -------
+    str | None
+        The project value, or None when no project or several are named.
+    """
+    if content is None or not content.parts:
+        return None
+    text = "\n".join(part.text for part in content.parts if part.text)
+    names = [project.value for project in TargetProject if project.value in text]
+    return names[0] if len(names) == 1 else None
+
+
+class ProjectContextPrefetcher(BaseAgent):
+    """Gather project context without the model when the project is explicit.
+
+    Writes :data:`PROJECT_CONTEXT_KEY` to session state: the output of
+    :func:`~content_generator.tools.gather_project_context`, or an empty
+    string when the request does not name exactly one project, in which
+    case the template analyzer falls back to calling the tool itself.
+    """
+
+    async def _run_async_impl(
+        self,
+        ctx: InvocationContext,
+    ) -> collections.abc.AsyncGenerator[Event]:
+        project_name = find_project_name(ctx.user_content)
+        context = ""
+        if project_name is not None:
+            context = await asyncio.to_thread(gather_project_context, project_name)
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={PROJECT_CONTEXT_KEY: context}),
+        )
@@ -5,13 +5,17 @@ from __future__ import annotations
 import typing as t
 
 import pytest
+from google.adk.events import EventActions
 
 
 class FakeContext:
     """Minimal stand-in for ADK Context in tests."""
 
+    __slots__ = ("actions", "state")
+
     def __init__(self) -> None:
         self.state: dict[str, t.Any] = {}
+        self.actions = EventActions()
 
 
 @pytest.fixture()
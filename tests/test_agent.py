@@ -6,8 +6,13 @@ an API key or making any LLM calls.
 
 from __future__ import annotations
 
+import itertools
+import typing as t
+
+import pytest
 from google.adk.agents import Agent, LoopAgent, SequentialAgent
 
+from content_generator import tools
 from content_generator_agent.agent import (
     code_generator,
     content_planner,
@@ -16,19 +21,25 @@ from content_generator_agent.agent import (
     validation_loop,
     validator,
 )
+from content_generator_agent.llm_cache import (
+    forget_pending_request,
+    store_response,
+    use_cached_response,
+)
 
 
 def test_root_agent_is_sequential() -> None:
     assert isinstance(root_agent, SequentialAgent)
 
 
-def test_root_agent_has_four_sub_agents() -> None:
-    assert len(root_agent.sub_agents) == 4
+def test_root_agent_has_five_sub_agents() -> None:
+    assert len(root_agent.sub_agents) == 5
 
 
 def test_root_agent_sub_agent_order() -> None:
     names = [agent.name for agent in root_agent.sub_agents]
     assert names == [
+        "project_prefetcher",
         "template_analyzer",
         "content_planner",
         "code_generator",
@@ -40,87 +51,88 @@ def test_root_agent_name() -> None:
     assert root_agent.name == "content_generator"
 
 
-def test_template_analyzer_is_llm_agent() -> None:
-    assert isinstance(template_analyzer, Agent)
-
-
-def test_template_analyzer_output_key() -> None:
-    assert template_analyzer.output_key == "template_analysis"
-
-
-def test_template_analyzer_include_contents_default() -> None:
-    assert template_analyzer.include_contents == "default"
-
-
-def test_template_analyzer_disallow_transfers() -> None:
-    assert template_analyzer.disallow_transfer_to_parent is True
-    assert template_analyzer.disallow_transfer_to_peers is True
-
-
-def test_template_analyzer_has_tools() -> None:
-    assert len(template_analyzer.tools) == 4
-
-
-def test_template_analyzer_temperature() -> None:
-    config = template_analyzer.generate_content_config
-    assert config is not None
-    assert config.temperature == 0.0
-
-
-def test_content_planner_is_llm_agent() -> None:
-    assert isinstance(content_planner, Agent)
-
-
-def test_content_planner_output_key() -> None:
-    assert content_planner.output_key == "lesson_plan"
-
-
-def test_content_planner_include_contents_none() -> None:
-    assert content_planner.include_contents == "none"
-
-
-def test_content_planner_disallow_transfers() -> None:
-    assert content_planner.disallow_transfer_to_parent is True
-    assert content_planner.disallow_transfer_to_peers is True
-
-
-def test_content_planner_references_template_analysis() -> None:
-    assert isinstance(content_planner.instruction, str)
-    assert "{template_analysis}" in content_planner.instruction
-
-
-def test_content_planner_temperature() -> None:
-    config = content_planner.generate_content_config
+class AgentFixture(t.NamedTuple):
+    """Parametrize fixture describing one LLM stage's expected config."""
+
+    test_id: str
+    agent: Agent
+    output_key: str | None
+    include_contents: str
+    temperature: float
+    placeholder: str | None
+    tool_count: int
+
+
+AGENT_FIXTURES = [
+    AgentFixture(
+        test_id="template_analyzer",
+        agent=template_analyzer,
+        output_key="template_analysis",
+        include_contents="default",
+        temperature=0.0,
+        placeholder=None,
+        tool_count=1,
+    ),
+    AgentFixture(
+        test_id="content_planner",
+        agent=content_planner,
+        output_key="lesson_plan",
+        include_contents="none",
+        temperature=0.5,
+        placeholder="{template_analysis}",
+        tool_count=1,
+    ),
+    AgentFixture(
+        test_id="code_generator",
+        agent=code_generator,
+        output_key="generated_code_summary",
+        include_contents="none",
+        temperature=0.1,
+        placeholder="{lesson_plan}",
+        tool_count=2,
+    ),
+    AgentFixture(
+        test_id="validator",
+        agent=validator,
+        output_key=None,
+        include_contents="none",
+        temperature=0.0,
+        placeholder="{generated_code_summary}",
+        tool_count=7,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(AgentFixture._fields),
+    AGENT_FIXTURES,
+    ids=[f.test_id for f in AGENT_FIXTURES],
+)
+def test_llm_agent_config(
+    test_id: str,
+    agent: Agent,
+    output_key: str | None,
+    include_contents: str,
+    temperature: float,
+    placeholder: str | None,
+    tool_count: int,
+) -> None:
+    assert isinstance(agent, Agent)
+    assert agent.output_key == output_key
+    assert agent.include_contents == include_contents
+    assert agent.disallow_transfer_to_parent is True
+    assert agent.disallow_transfer_to_peers is True
+    config = agent.generate_content_config
     assert config is not None
-    assert config.temperature == 0.5
-
-
-def test_code_generator_is_llm_agent() -> None:
-    assert isinstance(code_generator, Agent)
-
-
-def test_code_generator_output_key() -> None:
-    assert code_generator.output_key == "generated_code_summary"
+    assert config.temperature == temperature
+    assert isinstance(agent.instruction, str)
+    if placeholder is not None:
+        assert placeholder in agent.instruction
+    assert len(agent.tools) == tool_count
 
 
-def test_code_generator_include_contents_none() -> None:
-    assert code_generator.include_contents == "none"
-
-
-def test_code_generator_disallow_transfers() -> None:
-    assert code_generator.disallow_transfer_to_parent is True
-    assert code_generator.disallow_transfer_to_peers is True
-
-
-def test_code_generator_references_lesson_plan() -> None:
-    assert isinstance(code_generator.instruction, str)
-    assert "{lesson_plan}" in code_generator.instruction
-
-
-def test_code_generator_temperature() -> None:
-    config = code_generator.generate_content_config
-    assert config is not None
-    assert config.temperature == 0.1
+def test_template_analyzer_has_tools() -> None:
+    assert template_analyzer.tools == [tools.gather_project_context]
 
 
 def _tool_name(tool: object) -> str:
@@ -130,48 +142,16 @@ def _tool_name(tool: object) -> str:
 
 def test_code_generator_has_strip_fences_tool() -> None:
     """code_generator should have strip_code_fences for cleaning LLM output."""
-    tool_names = [_tool_name(t) for t in code_generator.tools]
+    tool_names = [_tool_name(tool) for tool in code_generator.tools]
     assert "strip_code_fences" in tool_names
 
 
-def test_validator_is_llm_agent() -> None:
-    assert isinstance(validator, Agent)
-
-
-def test_validator_no_output_key() -> None:
-    assert validator.output_key is None
-
-
-def test_validator_include_contents_none() -> None:
-    assert validator.include_contents == "none"
-
-
-def test_validator_disallow_transfers() -> None:
-    assert validator.disallow_transfer_to_parent is True
-    assert validator.disallow_transfer_to_peers is True
-
-
-def test_validator_references_generated_code() -> None:
-    assert isinstance(validator.instruction, str)
-    assert "{generated_code_summary}" in validator.instruction
-
-
-def test_validator_has_validation_tools() -> None:
-    assert len(validator.tools) == 7
-
-
 def test_validator_has_exit_loop_tool() -> None:
     """Validator must have exit_loop to signal successful completion."""
-    tool_names = [_tool_name(t) for t in validator.tools]
+    tool_names = [_tool_name(tool) for tool in validator.tools]
     assert "exit_loop" in tool_names
 
 
-def test_validator_temperature() -> None:
-    config = validator.generate_content_config
-    assert config is not None
-    assert config.temperature == 0.0
-
-
 def test_validation_loop_is_loop_agent() -> None:
     """The validation stage should be wrapped in a LoopAgent."""
     assert isinstance(validation_loop, LoopAgent)
@@ -189,25 +169,32 @@ def test_validator_inside_loop() -> None:
 
 
 def test_state_placeholders_output_keys_match() -> None:
-    # template_analyzer outputs "template_analysis"
-    assert template_analyzer.output_key == "template_analysis"
-    assert isinstance(content_planner.instruction, str)
-    assert "{template_analysis}" in content_planner.instruction
-
-    # content_planner outputs "lesson_plan"
-    assert content_planner.output_key == "lesson_plan"
-    assert isinstance(code_generator.instruction, str)
-    assert "{lesson_plan}" in code_generator.instruction
-
-    # code_generator outputs "generated_code_summary"
-    assert code_generator.output_key == "generated_code_summary"
-    assert isinstance(validator.instruction, str)
-    assert "{generated_code_summary}" in validator.instruction
+    """Each stage's instruction reads the previous stage's output_key."""
+    stages = [template_analyzer, content_planner, code_generator, validator]
+    for producer, consumer in itertools.pairwise(stages):
+        assert isinstance(consumer.instruction, str)
+        assert f"{{{producer.output_key}}}" in consumer.instruction
 
 
 def test_state_placeholders_no_optional() -> None:
-    for agent in [content_planner, code_generator, validator]:
+    for agent in [template_analyzer, content_planner, code_generator, validator]:
         assert isinstance(agent.instruction, str)
-        assert "{?" not in agent.instruction, (
+        assert "?}" not in agent.instruction, (
             f"{agent.name} uses optional placeholder syntax"
         )
+
+
+def test_only_template_analyzer_uses_response_cache() -> None:
+    """Agents that write files never replay cached turns."""
+    assert template_analyzer.before_model_callback is use_cached_response
+    assert template_analyzer.after_model_callback is store_response
+    assert template_analyzer.on_model_error_callback is forget_pending_request
+    for agent in [content_planner, code_generator, validator]:
+        assert agent.before_model_callback is None
+        assert agent.after_model_callback is None
+
+
+def test_deterministic_agents_share_config() -> None:
+    assert template_analyzer.generate_content_config is (
+        validator.generate_content_config
+    )
@@ -1,14 +1,24 @@
 """End-to-end tests for the content_generator_agent.
 
-These tests require a GOOGLE_API_KEY environment variable and make
-actual API calls. They are skipped in CI without the key.
+The live test requires a GOOGLE_API_KEY environment variable and makes
+actual API calls; it is skipped in CI without the key.  The offline test
+drives the same pipeline with a scripted model so the stage wiring is
+covered everywhere.
 """
 
 from __future__ import annotations
 
+import collections.abc
 import os
 
+import pydantic
 import pytest
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from content_generator_agent.llm_cache import clear_response_cache
 
 _skip_no_api_key = pytest.mark.skipif(
     not os.environ.get("GOOGLE_API_KEY"),
@@ -33,8 +43,6 @@ async def test_content_generator_e2e_agent_responds() -> None:
         user_id="test_user",
     )
 
-    from google.genai import types
-
     user_content = types.Content(
         role="user",
         parts=[
@@ -57,3 +65,88 @@ async def test_content_generator_e2e_agent_responds() -> None:
     ]
 
     assert len(events) > 0
+
+
+class ScriptedLlm(BaseLlm):
+    """Offline model that answers every request with a numbered reply."""
+
+    requests: list[LlmRequest] = pydantic.Field(default_factory=list)
+
+    async def generate_content_async(
+        self,
+        llm_request: LlmRequest,
+        stream: bool = False,
+    ) -> collections.abc.AsyncGenerator[LlmResponse]:
+        self.requests.append(llm_request)
+        yield LlmResponse(
+            content=types.Content(
+                role="model",
+                parts=[types.Part(text=f"reply {len(self.requests)}")],
+            ),
+        )
+
+
+async def test_content_generator_pipeline_wiring_offline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Run the whole pipeline against a scripted model, no API key needed."""
+    from google.adk.runners import InMemoryRunner
+
+    from content_generator_agent import agent, prefetch
+
+    llm = ScriptedLlm(model="scripted")
+    for stage in [
+        agent.template_analyzer,
+        agent.content_planner,
+        agent.code_generator,
+        agent.validator,
+    ]:
+        monkeypatch.setattr(stage, "model", llm)
+    monkeypatch.setattr(
+        prefetch, "gather_project_context", lambda name: f"context for {name}"
+    )
+    clear_response_cache()
+
+    runner = InMemoryRunner(agent=agent.root_agent, app_name="test_offline")
+    session = await runner.session_service.create_session(
+        app_name="test_offline",
+        user_id="test_user",
+    )
+    events = [
+        event
+        async for event in runner.run_async(
+            user_id="test_user",
+            session_id=session.id,
+            new_message=types.Content(
+                role="user",
+                parts=[types.Part(text="Binary search lesson for learning-dsa")],
+            ),
+        )
+    ]
+    clear_response_cache()
+
+    authors = [event.author for event in events if event.content is not None]
+    assert authors == [
+        "template_analyzer",
+        "content_planner",
+        "code_generator",
+        "validator",
+        "validator",
+        "validator",
+    ]
+
+    instructions = [str(request.config.system_instruction) for request in llm.requests]
+    assert "context for learning-dsa" in instructions[0]
+    assert "reply 1" in instructions[1]
+    assert "reply 2" in instructions[2]
+    assert "reply 3" in instructions[3]
+
+    final = await runner.session_service.get_session(
+        app_name="test_offline",
+        user_id="test_user",
+        session_id=session.id,
+    )
+    assert final is not None
+    assert final.state["template_analysis"] == "reply 1"
+    assert final.state["lesson_plan"] == "reply 2"
+    assert final.state["generated_code_summary"] == "reply 3"
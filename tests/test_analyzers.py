@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import collections.abc
+import os
 import pathlib
+import typing as t
 
 import pytest
 
@@ -10,13 +13,19 @@ import content_generator.analyzers as analyzers_module
 from content_generator.analyzers import (
     analyze_existing_lessons,
     analyze_project_config,
+    clear_config_cache,
     extract_template_patterns,
     next_lesson_number,
     read_progression,
     read_source_file,
     read_template_with_fallback,
 )
-from content_generator.models import PedagogyStyle, TargetProject
+from content_generator.models import (
+    LessonTemplate,
+    PedagogyStyle,
+    ProjectConfig,
+    TargetProject,
+)
 from content_generator.project_registry import get_project_path
 
 _DSA_PATH = get_project_path(TargetProject.DSA)
@@ -33,12 +42,52 @@ _skip_no_asyncio = pytest.mark.skipif(
 )
 
 
+@pytest.fixture()
+def tmp_project(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> pathlib.Path:
+    """Register tmp_path as the root of every project."""
+    monkeypatch.setattr(analyzers_module, "get_project_path", lambda _: tmp_path)
+    return tmp_path
+
+
+FakeProject = collections.abc.Callable[[str], pathlib.Path]
+
+
+@pytest.fixture()
+def fake_project(tmp_project: pathlib.Path) -> FakeProject:
+    """Return a factory that writes pyproject.toml into ``tmp_project``."""
+
+    def make(pyproject_body: str) -> pathlib.Path:
+        (tmp_project / "pyproject.toml").write_text(pyproject_body, encoding="utf-8")
+        return tmp_project
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def dsa_config() -> ProjectConfig:
+    """Analyze the real DSA project's configuration once per module."""
+    return analyze_project_config(TargetProject.DSA)
+
+
+@pytest.fixture(scope="module")
+def dsa_lessons() -> list[dict[str, str]]:
+    """Walk the real DSA project's lessons once per module."""
+    return analyze_existing_lessons(TargetProject.DSA)
+
+
+@pytest.fixture(scope="module")
+def dsa_template() -> LessonTemplate:
+    """Extract the real DSA project's template once per module."""
+    return extract_template_patterns(TargetProject.DSA)
+
+
 @_skip_no_dsa
-def test_analyze_project_config_dsa() -> None:
-    config = analyze_project_config(TargetProject.DSA)
-    assert config.name is not None
-    assert config.mypy_strict is True
-    assert config.has_doctest_modules is True
+def test_analyze_project_config_dsa(dsa_config: ProjectConfig) -> None:
+    assert dsa_config.name is not None
+    assert dsa_config.mypy_strict is True
+    assert dsa_config.has_doctest_modules is True
 
 
 @_skip_no_asyncio
@@ -49,27 +98,89 @@ def test_analyze_project_config_asyncio() -> None:
 
 
 @_skip_no_dsa
-def test_analyze_project_config_source_dirs() -> None:
-    config = analyze_project_config(TargetProject.DSA)
-    assert "src" in config.source_dirs
+def test_analyze_project_config_source_dirs(dsa_config: ProjectConfig) -> None:
+    assert "src" in dsa_config.source_dirs
 
 
-def test_analyze_project_config_string_addopts(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
-) -> None:
+def test_analyze_project_config_string_addopts(fake_project: FakeProject) -> None:
     """Verify addopts as a single string is split correctly."""
-    pyproject = tmp_path / "pyproject.toml"
-    pyproject.write_text(
+    fake_project(
         '[project]\nname = "test"\n'
         "[tool.pytest.ini_options]\n"
-        'addopts = "--doctest-modules -v"\n',
-        encoding="utf-8",
+        'addopts = "--doctest-modules -v"\n'
     )
-    monkeypatch.setattr(analyzers_module, "get_project_path", lambda _: tmp_path)
     config = analyze_project_config(TargetProject.DSA)
     assert config.has_doctest_modules is True
 
 
+def test_analyze_project_config_tolerates_non_table_sections(
+    fake_project: FakeProject,
+) -> None:
+    """Scalar values where tables are expected fall back to defaults."""
+    fake_project('[project]\nname = "test"\n[tool]\npytest = "oops"\nmypy = 1\n')
+    config = analyze_project_config(TargetProject.DSA)
+    assert config.has_doctest_modules is False
+    assert config.mypy_strict is False
+    assert config.ruff_target_version == "py310"
+
+
+def test_analyze_project_config_source_dirs_deduplicated(
+    fake_project: FakeProject,
+) -> None:
+    """Existing source dirs are reported once each, in registry order."""
+    project_path = fake_project('[project]\nname = "test"\n')
+    (project_path / "app").mkdir()
+    (project_path / "src").mkdir()
+    config = analyze_project_config(TargetProject.LITESTAR)
+    assert config.source_dirs == ["src", "app"]
+
+
+def test_analyze_project_config_reuses_parse_until_changed(
+    monkeypatch: pytest.MonkeyPatch, fake_project: FakeProject
+) -> None:
+    """Unchanged pyproject.toml should be parsed once; edits invalidate."""
+    pyproject = (
+        fake_project(
+            '[project]\nname = "test"\n'
+            "[tool.pytest.ini_options]\n"
+            'addopts = "--doctest-modules"\n'
+        )
+        / "pyproject.toml"
+    )
+
+    parse_count = 0
+    real_loads = analyzers_module.tomllib.loads
+
+    def counting_loads(*args: t.Any, **kwargs: t.Any) -> dict[str, t.Any]:
+        nonlocal parse_count
+        parse_count += 1
+        return real_loads(*args, **kwargs)
+
+    monkeypatch.setattr(analyzers_module.tomllib, "loads", counting_loads)
+
+    assert analyze_project_config(TargetProject.DSA).has_doctest_modules is True
+    assert analyze_project_config(TargetProject.DSA).has_doctest_modules is True
+    assert parse_count == 1
+
+    pyproject.write_text('[project]\nname = "test-changed"\n', encoding="utf-8")
+    config = analyze_project_config(TargetProject.DSA)
+    assert config.name == "test-changed"
+    assert config.has_doctest_modules is False
+    assert parse_count == 2
+
+    clear_config_cache()
+    analyze_project_config(TargetProject.DSA)
+    assert parse_count == 3
+
+
+def test_analyze_project_config_missing_in_tmp_project_raises(
+    tmp_project: pathlib.Path,
+) -> None:
+    """A project root without pyproject.toml raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError, match=r"pyproject\.toml not found"):
+        analyze_project_config(TargetProject.DSA)
+
+
 def test_analyze_project_config_missing_raises(tmp_path: pathlib.Path) -> None:
     """Verify FileNotFoundError when pyproject.toml is absent."""
     # This test uses monkeypatching indirectly - the registry points
@@ -83,18 +194,18 @@ def test_analyze_project_config_missing_raises(tmp_path: pathlib.Path) -> None:
 
 
 @_skip_no_dsa
-def test_analyze_existing_lessons_dsa() -> None:
-    lessons = analyze_existing_lessons(TargetProject.DSA)
-    assert len(lessons) > 0
-    assert all("name" in lesson for lesson in lessons)
-    assert all("path" in lesson for lesson in lessons)
+def test_analyze_existing_lessons_dsa(dsa_lessons: list[dict[str, str]]) -> None:
+    assert len(dsa_lessons) > 0
+    assert all("name" in lesson for lesson in dsa_lessons)
+    assert all("path" in lesson for lesson in dsa_lessons)
 
 
 @_skip_no_dsa
-def test_analyze_existing_lessons_dsa_structure() -> None:
-    lessons = analyze_existing_lessons(TargetProject.DSA)
+def test_analyze_existing_lessons_dsa_structure(
+    dsa_lessons: list[dict[str, str]],
+) -> None:
     # Each lesson should have name and path keys
-    for lesson in lessons:
+    for lesson in dsa_lessons:
         assert "name" in lesson
         assert "path" in lesson
         assert lesson["path"].endswith(".py")
@@ -107,22 +218,22 @@ def test_analyze_existing_lessons_asyncio() -> None:
 
 
 @_skip_no_dsa
-def test_analyze_existing_lessons_excludes_dunder() -> None:
-    lessons = analyze_existing_lessons(TargetProject.DSA)
-    for lesson in lessons:
+def test_analyze_existing_lessons_excludes_dunder(
+    dsa_lessons: list[dict[str, str]],
+) -> None:
+    for lesson in dsa_lessons:
         assert not lesson["name"].startswith("__")
 
 
 def test_analyze_existing_lessons_app_based_scans_app_dir(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+    tmp_project: pathlib.Path,
 ) -> None:
     """APP_BASED projects should scan the app/ directory."""
-    app_dir = tmp_path / "app"
+    app_dir = tmp_project / "app"
     app_dir.mkdir()
     (app_dir / "main.py").write_text("# app", encoding="utf-8")
     (app_dir / "__init__.py").write_text("", encoding="utf-8")
 
-    monkeypatch.setattr(analyzers_module, "get_project_path", lambda _: tmp_path)
     lessons = analyze_existing_lessons(TargetProject.LITESTAR)
 
     names = [lesson["name"] for lesson in lessons]
@@ -130,25 +241,64 @@ def test_analyze_existing_lessons_app_based_scans_app_dir(
 
 
 def test_analyze_existing_lessons_app_based_excludes_dunder(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+    tmp_project: pathlib.Path,
 ) -> None:
     """APP_BASED projects should still exclude __init__.py."""
-    app_dir = tmp_path / "app"
+    app_dir = tmp_project / "app"
     app_dir.mkdir()
     (app_dir / "__init__.py").write_text("", encoding="utf-8")
 
-    monkeypatch.setattr(analyzers_module, "get_project_path", lambda _: tmp_path)
     lessons = analyze_existing_lessons(TargetProject.LITESTAR)
 
     assert len(lessons) == 0
 
 
+def test_analyze_existing_lessons_walks_nested_dirs_in_path_order(
+    tmp_project: pathlib.Path,
+) -> None:
+    """Nested lessons are found and ordered like ``sorted(rglob("*.py"))``."""
+    src_dir = tmp_project / "src"
+    nested = src_dir / "algorithms"
+    nested.mkdir(parents=True)
+    (src_dir / "b.py").write_text("", encoding="utf-8")
+    (src_dir / "a.py").write_text("", encoding="utf-8")
+    (nested / "001_intro.py").write_text("", encoding="utf-8")
+    (nested / "__init__.py").write_text("", encoding="utf-8")
+    (nested / "notes.txt").write_text("", encoding="utf-8")
+
+    lessons = analyze_existing_lessons(TargetProject.DSA)
+
+    assert [lesson["path"] for lesson in lessons] == [
+        str(pathlib.Path("src", "a.py")),
+        str(pathlib.Path("src", "algorithms", "001_intro.py")),
+        str(pathlib.Path("src", "b.py")),
+    ]
+    assert [lesson["name"] for lesson in lessons] == ["a", "001_intro", "b"]
+
+
+def test_analyze_existing_lessons_orders_dir_before_dashed_sibling(
+    tmp_project: pathlib.Path,
+) -> None:
+    """``src/a/x.py`` sorts before ``src/a-b/y.py`` as path components do."""
+    src_dir = tmp_project / "src"
+    (src_dir / "a").mkdir(parents=True)
+    (src_dir / "a-b").mkdir()
+    (src_dir / "a" / "x.py").write_text("", encoding="utf-8")
+    (src_dir / "a-b" / "y.py").write_text("", encoding="utf-8")
+
+    lessons = analyze_existing_lessons(TargetProject.DSA)
+
+    assert [lesson["path"] for lesson in lessons] == [
+        str(pathlib.Path("src", "a", "x.py")),
+        str(pathlib.Path("src", "a-b", "y.py")),
+    ]
+
+
 @_skip_no_dsa
-def test_extract_template_patterns_dsa() -> None:
-    template = extract_template_patterns(TargetProject.DSA)
-    assert template.project == TargetProject.DSA
-    assert len(template.template_content) > 0
-    assert len(template.conventions) > 0
+def test_extract_template_patterns_dsa(dsa_template: LessonTemplate) -> None:
+    assert dsa_template.project == TargetProject.DSA
+    assert len(dsa_template.template_content) > 0
+    assert len(dsa_template.conventions) > 0
 
 
 @_skip_no_asyncio
@@ -158,9 +308,55 @@ def test_extract_template_patterns_asyncio() -> None:
 
 
 @_skip_no_dsa
-def test_extract_template_patterns_example_lessons_limited() -> None:
+def test_extract_template_patterns_example_lessons_limited(
+    dsa_template: LessonTemplate,
+) -> None:
+    assert len(dsa_template.example_lessons) <= 3
+
+
+def test_extract_template_patterns_caps_examples_across_dirs(
+    tmp_project: pathlib.Path,
+) -> None:
+    """APP_BASED examples stop at three total, filling from app/ first."""
+    for src_dir, names in (("app", ["a.py", "b.py"]), ("src", ["c.py", "d.py"])):
+        (tmp_project / src_dir).mkdir()
+        for name in names:
+            (tmp_project / src_dir / name).write_text("", encoding="utf-8")
+
+    template = extract_template_patterns(TargetProject.LITESTAR)
+
+    assert template.example_lessons == [
+        str(pathlib.Path("app", "a.py")),
+        str(pathlib.Path("app", "b.py")),
+        str(pathlib.Path("src", "c.py")),
+    ]
+
+
+def test_extract_template_patterns_rereads_changed_template(
+    tmp_project: pathlib.Path,
+) -> None:
+    """Cached template reads should pick up edits to the template file."""
+    notes_dir = tmp_project / "notes"
+    notes_dir.mkdir()
+    template_file = notes_dir / "lesson_template.py"
+    template_file.write_text("# v1", encoding="utf-8")
+
+    assert extract_template_patterns(TargetProject.DSA).template_content == "# v1"
+
+    template_file.write_text("# version two", encoding="utf-8")
     template = extract_template_patterns(TargetProject.DSA)
-    assert len(template.example_lessons) <= 3
+    assert template.template_content == "# version two"
+
+
+def test_extract_template_patterns_reads_conventions_without_template(
+    tmp_project: pathlib.Path,
+) -> None:
+    """A missing lesson template must not prevent reading AGENTS.md."""
+    (tmp_project / "AGENTS.md").write_text("# Conventions", encoding="utf-8")
+
+    template = extract_template_patterns(TargetProject.DSA)
+    assert template.template_content == ""
+    assert template.conventions == "# Conventions"
 
 
 @_skip_no_dsa
@@ -176,6 +372,23 @@ def test_read_progression_asyncio() -> None:
     assert isinstance(progression, str)
 
 
+def test_read_progression_orders_md_before_txt(tmp_project: pathlib.Path) -> None:
+    """Markdown plans come first, then text plans, each sorted by name."""
+    notes_dir = tmp_project / "notes"
+    notes_dir.mkdir()
+    (notes_dir / "progression_b.md").write_text("b-md", encoding="utf-8")
+    (notes_dir / "progression_a.txt").write_text("a-txt", encoding="utf-8")
+    (notes_dir / "progression_a.md").write_text("a-md", encoding="utf-8")
+    (notes_dir / "roadmap.md").write_text("ignored", encoding="utf-8")
+    (notes_dir / "progression_old.rst").write_text("ignored", encoding="utf-8")
+
+    assert read_progression(TargetProject.DSA) == "a-md\n\nb-md\n\na-txt"
+
+
+def test_read_progression_missing_notes_dir(tmp_project: pathlib.Path) -> None:
+    assert read_progression(TargetProject.DSA) == ""
+
+
 def test_read_source_file_existing(tmp_path: pathlib.Path) -> None:
     test_file = tmp_path / "test.py"
     test_file.write_text("# test", encoding="utf-8")
@@ -184,44 +397,85 @@ def test_read_source_file_existing(tmp_path: pathlib.Path) -> None:
 
 
 def test_read_source_file_missing_raises() -> None:
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match="File not found"):
         read_source_file(pathlib.Path("/nonexistent/file.py"))
 
 
-def test_next_lesson_number_empty_dir(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
-) -> None:
+def test_read_source_file_rereads_after_edit(tmp_path: pathlib.Path) -> None:
+    test_file = tmp_path / "test.py"
+    test_file.write_text("# v1", encoding="utf-8")
+    assert read_source_file(test_file) == "# v1"
+    test_file.write_text("# version 2", encoding="utf-8")
+    assert read_source_file(test_file) == "# version 2"
+
+
+def test_next_lesson_number_empty_dir(tmp_project: pathlib.Path) -> None:
     """next_lesson_number should return 1 for an empty project."""
-    src_dir = tmp_path / "src"
+    src_dir = tmp_project / "src"
     src_dir.mkdir()
-    monkeypatch.setattr(analyzers_module, "get_project_path", lambda _: tmp_path)
     assert next_lesson_number(TargetProject.DSA) == 1
 
 
-def test_next_lesson_number_with_numbered_files(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
-) -> None:
+def test_next_lesson_number_with_numbered_files(tmp_project: pathlib.Path) -> None:
     """next_lesson_number should return max+1 from existing numbered files."""
-    src_dir = tmp_path / "src"
+    src_dir = tmp_project / "src"
     src_dir.mkdir()
     (src_dir / "001_intro.py").write_text("# intro", encoding="utf-8")
     (src_dir / "002_arrays.py").write_text("# arrays", encoding="utf-8")
     (src_dir / "005_trees.py").write_text("# trees", encoding="utf-8")
-    monkeypatch.setattr(analyzers_module, "get_project_path", lambda _: tmp_path)
     assert next_lesson_number(TargetProject.DSA) == 6
 
 
-def test_next_lesson_number_non_numbered_files(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
-) -> None:
+def test_next_lesson_number_non_numbered_files(tmp_project: pathlib.Path) -> None:
     """next_lesson_number should return 1 when no files have numeric prefixes."""
-    src_dir = tmp_path / "src"
+    src_dir = tmp_project / "src"
     src_dir.mkdir()
     (src_dir / "helpers.py").write_text("# helpers", encoding="utf-8")
-    monkeypatch.setattr(analyzers_module, "get_project_path", lambda _: tmp_path)
     assert next_lesson_number(TargetProject.DSA) == 1
 
 
+def test_next_lesson_number_only_leading_digits_count(
+    tmp_project: pathlib.Path,
+) -> None:
+    """Digits after the first non-digit character must not affect numbering."""
+    src_dir = tmp_project / "src"
+    src_dir.mkdir()
+    (src_dir / "010_sorting.py").write_text("# sorting", encoding="utf-8")
+    (src_dir / "lesson_99.py").write_text("# unnumbered", encoding="utf-8")
+    (src_dir / "3sum.py").write_text("# three sum", encoding="utf-8")
+    assert next_lesson_number(TargetProject.DSA) == 11
+
+
+def test_next_lesson_number_scans_nested_lesson_dirs(tmp_project: pathlib.Path) -> None:
+    """Numbered lessons in subdirectories (e.g. src/algorithms) are counted."""
+    nested = tmp_project / "src" / "algorithms"
+    nested.mkdir(parents=True)
+    (tmp_project / "src" / "002_basics.py").write_text("# basics", encoding="utf-8")
+    (nested / "007_graphs.py").write_text("# graphs", encoding="utf-8")
+    (nested / "010_notes.txt").write_text("not a lesson", encoding="utf-8")
+    assert next_lesson_number(TargetProject.DSA) == 8
+
+
+def test_next_lesson_number_skips_unreadable_dirs(
+    tmp_project: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An unreadable subdirectory is skipped, as os.walk does, not raised."""
+    locked = tmp_project / "src" / "locked"
+    locked.mkdir(parents=True)
+    (tmp_project / "src" / "004_queues.py").write_text("# queues", encoding="utf-8")
+    (locked / "009_hidden.py").write_text("# hidden", encoding="utf-8")
+    real_scandir = os.scandir
+
+    def scandir(path: t.Any = ".") -> t.Any:
+        if pathlib.Path(path) == locked:
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    assert next_lesson_number(TargetProject.DSA) == 5
+
+
 @_skip_no_dsa
 def test_next_lesson_number_dsa_real() -> None:
     """next_lesson_number should return > 1 for DSA with existing lessons."""
@@ -230,24 +484,20 @@ def test_next_lesson_number_dsa_real() -> None:
 
 
 def test_read_template_with_fallback_project_template(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+    tmp_project: pathlib.Path,
 ) -> None:
     """Should return project template when it exists."""
-    notes_dir = tmp_path / "notes"
+    notes_dir = tmp_project / "notes"
     notes_dir.mkdir()
     (notes_dir / "lesson_template.py").write_text(
         "# project template", encoding="utf-8"
     )
-    monkeypatch.setattr(analyzers_module, "get_project_path", lambda _: tmp_path)
     result = read_template_with_fallback(TargetProject.DSA, PedagogyStyle.CONCEPT_FIRST)
     assert result == "# project template"
 
 
-def test_read_template_with_fallback_builtin(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
-) -> None:
+def test_read_template_with_fallback_builtin(tmp_project: pathlib.Path) -> None:
     """Should fall back to builtin template when project has none."""
-    monkeypatch.setattr(analyzers_module, "get_project_path", lambda _: tmp_path)
     result = read_template_with_fallback(
         TargetProject.FASTAPI, PedagogyStyle.APPLICATION_FIRST
     )
@@ -0,0 +1,94 @@
+"""Tests for content_generator_agent.batch."""
+
+from __future__ import annotations
+
+import asyncio
+import collections.abc
+import typing as t
+
+import pydantic
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.genai import types
+
+from content_generator_agent.batch import run_batch
+
+if t.TYPE_CHECKING:
+    from google.adk.agents.invocation_context import InvocationContext
+
+
+class EchoAgent(BaseAgent):
+    """Answers with the request text, logging when each run starts and ends."""
+
+    log: list[str] = pydantic.Field(default_factory=list)
+
+    async def _run_async_impl(
+        self,
+        ctx: InvocationContext,
+    ) -> collections.abc.AsyncGenerator[Event]:
+        assert ctx.user_content is not None
+        assert ctx.user_content.parts
+        text = ctx.user_content.parts[0].text or ""
+        self.log.append(f"start {text}")
+        if text.startswith("boom"):
+            msg = f"failed {text}"
+            raise RuntimeError(msg)
+        await asyncio.sleep(0.01)
+        self.log.append(f"end {text}")
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+        )
+
+
+async def test_run_batch_returns_results_in_request_order() -> None:
+    requests = ["a for learning-dsa", "b for learning-asyncio", "c for learning-dsa"]
+    results = await run_batch(requests, agent=EchoAgent(name="echo"))
+    assert [result.request for result in results] == requests
+    assert [result.final_text for result in results] == requests
+
+
+async def test_run_batch_serializes_same_project() -> None:
+    agent = EchoAgent(name="echo")
+    await run_batch(["a for learning-dsa", "b for learning-dsa"], agent=agent)
+    assert agent.log == [
+        "start a for learning-dsa",
+        "end a for learning-dsa",
+        "start b for learning-dsa",
+        "end b for learning-dsa",
+    ]
+
+
+async def test_run_batch_overlaps_different_projects() -> None:
+    agent = EchoAgent(name="echo")
+    await run_batch(["a for learning-dsa", "b for learning-asyncio"], agent=agent)
+    assert agent.log[:2] == ["start a for learning-dsa", "start b for learning-asyncio"]
+
+
+async def test_run_batch_respects_max_concurrency() -> None:
+    agent = EchoAgent(name="echo")
+    await run_batch(
+        ["a for learning-dsa", "b for learning-asyncio"],
+        agent=agent,
+        max_concurrency=1,
+    )
+    assert agent.log[1] == "end a for learning-dsa"
+
+
+async def test_run_batch_records_failures_per_request() -> None:
+    agent = EchoAgent(name="echo")
+    results = await run_batch(
+        ["boom for learning-dsa", "b for learning-dsa", "c for learning-asyncio"],
+        agent=agent,
+    )
+    assert [result.error for result in results] == [
+        "RuntimeError: failed boom for learning-dsa",
+        "",
+        "",
+    ]
+    assert [result.final_text for result in results] == [
+        "",
+        "b for learning-dsa",
+        "c for learning-asyncio",
+    ]
@@ -73,3 +73,10 @@ def test_all_pedagogy_styles_have_templates() -> None:
     for style in PedagogyStyle:
         content = get_builtin_template(style)
         assert len(content) > 0
+
+
+def test_builtin_template_read_once_per_style() -> None:
+    """Repeated lookups should return the cached string, not re-read the file."""
+    first = get_builtin_template(PedagogyStyle.CONCEPT_FIRST)
+    second = get_builtin_template(PedagogyStyle.CONCEPT_FIRST)
+    assert first is second
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import typing as t
 from collections.abc import Iterator
 
 import pytest
@@ -65,11 +66,10 @@ def test_list_domains_returns_sorted() -> None:
     assert names == sorted(names)
 
 
-def test_all_domains_reference_valid_project() -> None:
+@pytest.mark.parametrize("name", list_domains())
+def test_all_domains_reference_valid_project(name: str) -> None:
     """Every registered domain must reference a valid TargetProject."""
-    for name in list_domains():
-        config = get_domain(name)
-        assert config.project in TargetProject
+    assert get_domain(name).project in TargetProject
 
 
 def test_domain_project_path_delegates_to_registry() -> None:
@@ -95,24 +95,61 @@ def test_builtin_domains_exist() -> None:
     assert "fastapi" in names
 
 
-def test_dsa_domain_config() -> None:
-    config = get_domain("dsa")
-    assert config.pedagogy == PedagogyStyle.CONCEPT_FIRST
-    assert config.lesson_dir == "src/algorithms"
-    assert config.doctest_strategy == "deterministic"
-
-
-def test_asyncio_domain_config() -> None:
-    config = get_domain("asyncio")
-    assert config.pedagogy == PedagogyStyle.CONCEPT_FIRST
-    assert config.doctest_strategy == "ellipsis"
-
+class DomainFixture(t.NamedTuple):
+    """Parametrize fixture describing one built-in domain."""
 
-def test_litestar_domain_config() -> None:
-    config = get_domain("litestar")
-    assert config.pedagogy == PedagogyStyle.INTEGRATION_FIRST
+    test_id: str
+    name: str
+    pedagogy: PedagogyStyle
+    lesson_dir: str
+    doctest_strategy: str
 
 
-def test_fastapi_domain_config() -> None:
-    config = get_domain("fastapi")
-    assert config.pedagogy == PedagogyStyle.APPLICATION_FIRST
+DOMAIN_FIXTURES = [
+    DomainFixture(
+        test_id="dsa",
+        name="dsa",
+        pedagogy=PedagogyStyle.CONCEPT_FIRST,
+        lesson_dir="src/algorithms",
+        doctest_strategy="deterministic",
+    ),
+    DomainFixture(
+        test_id="asyncio",
+        name="asyncio",
+        pedagogy=PedagogyStyle.CONCEPT_FIRST,
+        lesson_dir="src",
+        doctest_strategy="ellipsis",
+    ),
+    DomainFixture(
+        test_id="litestar",
+        name="litestar",
+        pedagogy=PedagogyStyle.INTEGRATION_FIRST,
+        lesson_dir="src",
+        doctest_strategy="skip",
+    ),
+    DomainFixture(
+        test_id="fastapi",
+        name="fastapi",
+        pedagogy=PedagogyStyle.APPLICATION_FIRST,
+        lesson_dir="src",
+        doctest_strategy="skip",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(DomainFixture._fields),
+    DOMAIN_FIXTURES,
+    ids=[f.test_id for f in DOMAIN_FIXTURES],
+)
+def test_builtin_domain_config(
+    test_id: str,
+    name: str,
+    pedagogy: PedagogyStyle,
+    lesson_dir: str,
+    doctest_strategy: str,
+) -> None:
+    config = get_domain(name)
+    assert config.pedagogy == pedagogy
+    assert config.lesson_dir == lesson_dir
+    assert config.doctest_strategy == doctest_strategy
@@ -0,0 +1,126 @@
+"""Tests for content_generator_agent.llm_cache."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from content_generator_agent import llm_cache
+
+
+class FakeCallbackContext:
+    """Minimal stand-in for the ADK callback Context."""
+
+    def __init__(self, invocation_id: str = "inv-1") -> None:
+        self.invocation_id = invocation_id
+        self.agent_name = "template_analyzer"
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache() -> t.Iterator[None]:
+    llm_cache.clear_response_cache()
+    yield
+    llm_cache.clear_response_cache()
+
+
+def _request(text: str) -> LlmRequest:
+    return LlmRequest(
+        model="gemini-2.5-flash-lite",
+        contents=[types.Content(role="user", parts=[types.Part(text=text)])],
+        config=types.GenerateContentConfig(temperature=0.0),
+    )
+
+
+def _response(text: str) -> LlmResponse:
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+    )
+
+
+def _answer(text: str) -> str | None:
+    """Text of the response served from the cache, if any."""
+    cached = llm_cache.use_cached_response(
+        FakeCallbackContext(),  # type: ignore[arg-type]
+        _request(text),
+    )
+    if cached is None or cached.content is None or not cached.content.parts:
+        return None
+    return cached.content.parts[0].text
+
+
+def _call_model(request_text: str, response: LlmResponse) -> None:
+    """Run both callbacks around a model call that returns ``response``."""
+    context = FakeCallbackContext()
+    assert (
+        llm_cache.use_cached_response(
+            context,  # type: ignore[arg-type]
+            _request(request_text),
+        )
+        is None
+    )
+    llm_cache.store_response(context, response)  # type: ignore[arg-type]
+
+
+def test_miss_then_hit() -> None:
+    assert _answer("analyze learning-dsa") is None
+    _call_model("analyze learning-dsa", _response("analysis"))
+    assert _answer("analyze learning-dsa") == "analysis"
+
+
+def test_different_request_misses() -> None:
+    _call_model("analyze learning-dsa", _response("analysis"))
+    assert _answer("analyze learning-asyncio") is None
+
+
+def test_partial_and_error_responses_not_cached() -> None:
+    partial = _response("ana")
+    partial.partial = True
+    _call_model("partial", partial)
+    assert _answer("partial") is None
+
+    _call_model("error", LlmResponse(error_code="500", error_message="boom"))
+    assert _answer("error") is None
+
+
+def test_lru_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(llm_cache, "_MAX_ENTRIES", 2)
+    _call_model("a", _response("A"))
+    _call_model("b", _response("B"))
+    assert _answer("a") == "A"
+    _call_model("c", _response("C"))
+    assert _answer("b") is None
+    assert _answer("a") == "A"
+    assert _answer("c") == "C"
+
+
+def test_hit_returns_copy() -> None:
+    _call_model("copy", _response("original"))
+    first = llm_cache.use_cached_response(
+        FakeCallbackContext(),  # type: ignore[arg-type]
+        _request("copy"),
+    )
+    assert first is not None
+    assert first.content is not None
+    assert first.content.parts
+    first.content.parts[0].text = "mutated"
+    assert _answer("copy") == "original"
+
+
+def test_failed_call_forgets_pending_request() -> None:
+    context = FakeCallbackContext()
+    request = _request("analyze learning-dsa")
+    assert llm_cache.use_cached_response(context, request) is None  # type: ignore[arg-type]
+    assert llm_cache._PENDING
+    assert (
+        llm_cache.forget_pending_request(
+            context,  # type: ignore[arg-type]
+            request,
+            RuntimeError("boom"),
+        )
+        is None
+    )
+    assert not llm_cache._PENDING
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import pathlib
+import typing as t
 
+import pydantic
 import pytest
 
 from content_generator.models import (
@@ -21,26 +23,62 @@ from content_generator.models import (
 )
 
 
-def test_target_project_values() -> None:
-    assert TargetProject.DSA.value == "learning-dsa"
-    assert TargetProject.ASYNCIO.value == "learning-asyncio"
-    assert TargetProject.LITESTAR.value == "learning-litestar"
-    assert TargetProject.FASTAPI.value == "learning-fastapi"
+class ProjectFixture(t.NamedTuple):
+    """Parametrize fixture pairing a target project with its value and category."""
 
+    test_id: str
+    project: TargetProject
+    value: str
+    category: TemplateCategory
 
-def test_target_project_all_have_categories() -> None:
-    for project in TargetProject:
-        assert project in PROJECT_CATEGORIES
 
+PROJECT_FIXTURES = [
+    ProjectFixture(
+        test_id="dsa",
+        project=TargetProject.DSA,
+        value="learning-dsa",
+        category=TemplateCategory.LESSON_BASED,
+    ),
+    ProjectFixture(
+        test_id="asyncio",
+        project=TargetProject.ASYNCIO,
+        value="learning-asyncio",
+        category=TemplateCategory.LESSON_BASED,
+    ),
+    ProjectFixture(
+        test_id="litestar",
+        project=TargetProject.LITESTAR,
+        value="learning-litestar",
+        category=TemplateCategory.APP_BASED,
+    ),
+    ProjectFixture(
+        test_id="fastapi",
+        project=TargetProject.FASTAPI,
+        value="learning-fastapi",
+        category=TemplateCategory.APP_BASED,
+    ),
+]
 
-def test_template_category_lesson_based() -> None:
-    assert PROJECT_CATEGORIES[TargetProject.DSA] == TemplateCategory.LESSON_BASED
-    assert PROJECT_CATEGORIES[TargetProject.ASYNCIO] == TemplateCategory.LESSON_BASED
+
+@pytest.mark.parametrize(
+    list(ProjectFixture._fields),
+    PROJECT_FIXTURES,
+    ids=[f.test_id for f in PROJECT_FIXTURES],
+)
+def test_target_project(
+    test_id: str,
+    project: TargetProject,
+    value: str,
+    category: TemplateCategory,
+) -> None:
+    assert project.value == value
+    assert TargetProject(value) is project
+    assert PROJECT_CATEGORIES[project] == category
 
 
-def test_template_category_app_based() -> None:
-    assert PROJECT_CATEGORIES[TargetProject.LITESTAR] == TemplateCategory.APP_BASED
-    assert PROJECT_CATEGORIES[TargetProject.FASTAPI] == TemplateCategory.APP_BASED
+@pytest.mark.parametrize("project", list(TargetProject), ids=str)
+def test_target_project_all_have_categories(project: TargetProject) -> None:
+    assert project in PROJECT_CATEGORIES
 
 
 def test_project_config_defaults() -> None:
@@ -116,6 +154,17 @@ def test_lesson_plan_full() -> None:
     assert len(plan.concepts) == 2
 
 
+def test_lesson_plan_rejects_unknown_fields() -> None:
+    with pytest.raises(pydantic.ValidationError, match="extra"):
+        LessonPlan(title="Binary Search", topic="binary_search", bogus=1)  # type: ignore[call-arg]
+
+
+def test_lesson_plan_is_frozen() -> None:
+    plan = LessonPlan(title="Binary Search", topic="binary_search")
+    with pytest.raises(pydantic.ValidationError, match="frozen"):
+        plan.title = "Linear Search"  # type: ignore[misc]
+
+
 def test_generated_content_creation() -> None:
     content = GeneratedContent(
         file_path=pathlib.Path("/tmp/test.py"),
@@ -126,6 +175,21 @@ def test_generated_content_creation() -> None:
     assert content.project == TargetProject.DSA
 
 
+def test_generated_content_coerces_inputs() -> None:
+    content = GeneratedContent(
+        file_path="/tmp/test.py",  # type: ignore[arg-type]
+        content="print('hello')",
+        project="learning-dsa",  # type: ignore[arg-type]
+    )
+    assert content.file_path == pathlib.Path("/tmp/test.py")
+    assert content.project is TargetProject.DSA
+
+
+def test_validation_result_rejects_wrong_types() -> None:
+    with pytest.raises(pydantic.ValidationError, match="mypy"):
+        ValidationResult(mypy=["not", "a", "string"])  # type: ignore[arg-type]
+
+
 def test_validation_result_defaults() -> None:
     result = ValidationResult()
     assert result.passed is False
@@ -135,6 +199,12 @@ def test_validation_result_defaults() -> None:
     assert result.pytest == ""
 
 
+def test_validation_result_defaults_not_shared() -> None:
+    first, second = ValidationResult(), ValidationResult()
+    first.errors.append("boom")
+    assert second.errors == []
+
+
 def test_validation_result_passing() -> None:
     result = ValidationResult(
         passed=True,
@@ -159,10 +229,17 @@ def test_enum_template_category_from_string() -> None:
     assert TemplateCategory("lesson_based") == TemplateCategory.LESSON_BASED
 
 
-def test_pedagogy_style_values() -> None:
-    assert PedagogyStyle.CONCEPT_FIRST.value == "concept_first"
-    assert PedagogyStyle.INTEGRATION_FIRST.value == "integration_first"
-    assert PedagogyStyle.APPLICATION_FIRST.value == "application_first"
+@pytest.mark.parametrize(
+    ("style", "value"),
+    [
+        (PedagogyStyle.CONCEPT_FIRST, "concept_first"),
+        (PedagogyStyle.INTEGRATION_FIRST, "integration_first"),
+        (PedagogyStyle.APPLICATION_FIRST, "application_first"),
+    ],
+    ids=["concept_first", "integration_first", "application_first"],
+)
+def test_pedagogy_style_values(style: PedagogyStyle, value: str) -> None:
+    assert style.value == value
 
 
 def test_pedagogy_style_from_string() -> None:
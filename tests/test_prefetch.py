@@ -0,0 +1,117 @@
+"""Tests for content_generator_agent.prefetch."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from content_generator_agent import prefetch
+
+
+class ProjectNameFixture(t.NamedTuple):
+    """Parametrize fixture pairing a user message with its named project."""
+
+    test_id: str
+    text: str
+    expected: str | None
+
+
+PROJECT_NAME_FIXTURES = [
+    ProjectNameFixture(
+        test_id="single_project",
+        text="Add a lesson on heaps to learning-dsa",
+        expected="learning-dsa",
+    ),
+    ProjectNameFixture(
+        test_id="no_project",
+        text="Add a lesson on heaps",
+        expected=None,
+    ),
+    ProjectNameFixture(
+        test_id="two_projects",
+        text="Compare learning-fastapi with learning-litestar",
+        expected=None,
+    ),
+]
+
+
+def _user_message(text: str) -> types.Content:
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+@pytest.mark.parametrize(
+    list(ProjectNameFixture._fields),
+    PROJECT_NAME_FIXTURES,
+    ids=[f.test_id for f in PROJECT_NAME_FIXTURES],
+)
+def test_find_project_name(test_id: str, text: str, expected: str | None) -> None:
+    assert prefetch.find_project_name(_user_message(text)) == expected
+
+
+def test_find_project_name_without_content() -> None:
+    assert prefetch.find_project_name(None) is None
+
+
+#: ADK app name used for prefetcher test sessions.
+_APP_NAME = "test_prefetch"
+
+#: User id owning prefetcher test sessions.
+_USER_ID = "test_user"
+
+
+async def _prefetched_state(text: str) -> dict[str, t.Any]:
+    """Run the prefetcher on one message and return the session state."""
+    runner = InMemoryRunner(
+        agent=prefetch.ProjectContextPrefetcher(name="project_prefetcher"),
+        app_name=_APP_NAME,
+    )
+    session = await runner.session_service.create_session(
+        app_name=_APP_NAME,
+        user_id=_USER_ID,
+    )
+    events = [
+        event
+        async for event in runner.run_async(
+            user_id=_USER_ID,
+            session_id=session.id,
+            new_message=_user_message(text),
+        )
+    ]
+    assert len(events) == 1
+    stored = await runner.session_service.get_session(
+        app_name=_APP_NAME,
+        user_id=_USER_ID,
+        session_id=session.id,
+    )
+    assert stored is not None
+    return stored.state
+
+
+async def test_prefetcher_stores_project_context(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def fake_gather(project_name: str) -> str:
+        calls.append(project_name)
+        return f"context for {project_name}"
+
+    monkeypatch.setattr(prefetch, "gather_project_context", fake_gather)
+    state = await _prefetched_state("New lesson for learning-asyncio")
+    assert state == {prefetch.PROJECT_CONTEXT_KEY: "context for learning-asyncio"}
+    assert calls == ["learning-asyncio"]
+
+
+async def test_prefetcher_leaves_context_empty_without_project(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail_gather(project_name: str) -> str:
+        raise AssertionError(project_name)
+
+    monkeypatch.setattr(prefetch, "gather_project_context", fail_gather)
+    assert await _prefetched_state("New lesson on queues") == {
+        prefetch.PROJECT_CONTEXT_KEY: ""
+    }
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import importlib
 import pathlib
+import typing as t
 
 import pytest
 
@@ -12,14 +12,15 @@ from content_generator.models import TargetProject
 from content_generator.project_registry import (
     ALLOWED_ROOTS,
     PROJECT_PATHS,
+    clear_registry_cache,
     get_project_path,
     validate_path,
 )
 
 
-def test_project_paths_all_have_paths() -> None:
-    for project in TargetProject:
-        assert project in PROJECT_PATHS
+@pytest.mark.parametrize("project", list(TargetProject), ids=str)
+def test_project_paths_all_have_paths(project: TargetProject) -> None:
+    assert project in PROJECT_PATHS
 
 
 def test_project_paths_are_absolute() -> None:
@@ -38,10 +39,9 @@ def test_get_project_path_returns_path() -> None:
     assert "learning-dsa" in str(path)
 
 
-def test_get_project_path_all_resolvable() -> None:
-    for project in TargetProject:
-        path = get_project_path(project)
-        assert isinstance(path, pathlib.Path)
+@pytest.mark.parametrize("project", list(TargetProject), ids=str)
+def test_get_project_path_all_resolvable(project: TargetProject) -> None:
+    assert isinstance(get_project_path(project), pathlib.Path)
 
 
 def test_allowed_roots_is_frozenset() -> None:
@@ -53,11 +53,69 @@ def test_allowed_roots_contains_all_project_paths() -> None:
         assert path in ALLOWED_ROOTS
 
 
-def test_validate_path_within_project() -> None:
-    project_path = get_project_path(TargetProject.DSA)
-    test_path = project_path / "src" / "test.py"
-    result = validate_path(test_path)
+class ValidatePathFixture(t.NamedTuple):
+    """Parametrize fixture for a path relative to a project root."""
+
+    test_id: str
+    project: TargetProject
+    relative_path: str
+    allowed: bool
+
+
+VALIDATE_PATH_FIXTURES = [
+    ValidatePathFixture(
+        test_id="within_project",
+        project=TargetProject.DSA,
+        relative_path="src/test.py",
+        allowed=True,
+    ),
+    ValidatePathFixture(
+        test_id="root_itself",
+        project=TargetProject.DSA,
+        relative_path=".",
+        allowed=True,
+    ),
+    ValidatePathFixture(
+        test_id="dotdot_back_inside",
+        project=TargetProject.ASYNCIO,
+        relative_path="src/../src/test.py",
+        allowed=True,
+    ),
+    ValidatePathFixture(
+        test_id="traversal",
+        project=TargetProject.DSA,
+        relative_path="../../etc/passwd",
+        allowed=False,
+    ),
+    ValidatePathFixture(
+        test_id="sibling_with_root_prefix",
+        project=TargetProject.DSA,
+        relative_path="../learning-dsa-evil/x.py",
+        allowed=False,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ValidatePathFixture._fields),
+    VALIDATE_PATH_FIXTURES,
+    ids=[f.test_id for f in VALIDATE_PATH_FIXTURES],
+)
+def test_validate_path(
+    test_id: str,
+    project: TargetProject,
+    relative_path: str,
+    allowed: bool,
+) -> None:
+    path = get_project_path(project) / relative_path
+    if not allowed:
+        with pytest.raises(ValueError, match="not within any allowed"):
+            validate_path(path)
+        return
+    result = validate_path(path)
+    assert result == path.resolve()
     assert result.is_absolute()
+    assert ".." not in result.parts
 
 
 def test_validate_path_rejects_outside_roots() -> None:
@@ -65,30 +123,43 @@ def test_validate_path_rejects_outside_roots() -> None:
         validate_path(pathlib.Path("/tmp/evil/script.py"))
 
 
-def test_validate_path_rejects_traversal() -> None:
-    project_path = get_project_path(TargetProject.DSA)
-    traversal_path = project_path / ".." / ".." / "etc" / "passwd"
-    with pytest.raises(ValueError, match="not within any allowed"):
-        validate_path(traversal_path)
+@pytest.fixture()
+def study_base(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> t.Iterator[pathlib.Path]:
+    """Point the registry at ``tmp_path`` and restore it afterwards."""
+    monkeypatch.setenv("CONTENT_GENERATOR_STUDY_BASE", str(tmp_path))
+    clear_registry_cache()
+    yield tmp_path
+    monkeypatch.delenv("CONTENT_GENERATOR_STUDY_BASE")
+    clear_registry_cache()
 
 
-def test_validate_path_resolves_symlinks() -> None:
-    project_path = get_project_path(TargetProject.ASYNCIO)
-    dotdot_path = project_path / "src" / ".." / "src" / "test.py"
-    result = validate_path(dotdot_path)
-    assert ".." not in str(result)
+def test_study_base_env_override(study_base: pathlib.Path) -> None:
+    base = project_registry_module._STUDY_BASE
+    assert base == study_base
+    dsa_path = project_registry_module.PROJECT_PATHS[TargetProject.DSA]
+    assert dsa_path == study_base / "learning-dsa"
+    assert get_project_path(TargetProject.DSA) == dsa_path
+    assert validate_path(dsa_path / "src" / "x.py") == (
+        study_base.resolve() / "learning-dsa" / "src" / "x.py"
+    )
 
 
-def test_study_base_env_override(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+def test_clear_registry_cache_rereads_environment(
+    monkeypatch: pytest.MonkeyPatch, study_base: pathlib.Path
 ) -> None:
-    monkeypatch.setenv("CONTENT_GENERATOR_STUDY_BASE", str(tmp_path))
-    importlib.reload(project_registry_module)
-    try:
-        reloaded_base = project_registry_module._STUDY_BASE
-        assert reloaded_base == tmp_path
-        dsa_path = project_registry_module.PROJECT_PATHS[TargetProject.DSA]
-        assert str(dsa_path).startswith(str(tmp_path))
-    finally:
-        monkeypatch.delenv("CONTENT_GENERATOR_STUDY_BASE")
-        importlib.reload(project_registry_module)
+    """Paths stay fixed until the cache is cleared."""
+    other = study_base / "other"
+    get_project_path(TargetProject.DSA)
+    monkeypatch.setenv("CONTENT_GENERATOR_STUDY_BASE", str(other))
+    assert get_project_path(TargetProject.DSA) == study_base / "learning-dsa"
+    clear_registry_cache()
+    assert get_project_path(TargetProject.DSA) == other / "learning-dsa"
+    with pytest.raises(ValueError, match="not within any allowed"):
+        validate_path(study_base / "learning-dsa" / "x.py")
+
+
+def test_unknown_module_attribute_raises() -> None:
+    with pytest.raises(AttributeError, match="NOT_A_SETTING"):
+        _ = project_registry_module.NOT_A_SETTING
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import re
+
+import pytest
+
 from content_generator_agent.prompts import (
     CODE_GENERATOR_INSTRUCTION,
     CONTENT_PLANNER_INSTRUCTION,
@@ -10,20 +14,18 @@ from content_generator_agent.prompts import (
 )
 
 
-def test_template_analyzer_instruction_non_empty() -> None:
-    assert len(TEMPLATE_ANALYZER_INSTRUCTION) > 0
-
-
-def test_content_planner_instruction_non_empty() -> None:
-    assert len(CONTENT_PLANNER_INSTRUCTION) > 0
-
-
-def test_code_generator_instruction_non_empty() -> None:
-    assert len(CODE_GENERATOR_INSTRUCTION) > 0
-
-
-def test_validator_instruction_non_empty() -> None:
-    assert len(VALIDATOR_INSTRUCTION) > 0
+@pytest.mark.parametrize(
+    "instruction",
+    [
+        TEMPLATE_ANALYZER_INSTRUCTION,
+        CONTENT_PLANNER_INSTRUCTION,
+        CODE_GENERATOR_INSTRUCTION,
+        VALIDATOR_INSTRUCTION,
+    ],
+    ids=["template_analyzer", "content_planner", "code_generator", "validator"],
+)
+def test_instruction_non_empty(instruction: str) -> None:
+    assert len(instruction) > 0
 
 
 def test_content_planner_references_template_analysis() -> None:
@@ -48,5 +50,21 @@ def test_validator_mentions_exit_loop() -> None:
 
 def test_validator_no_maximum_cycles_text() -> None:
     """Validator should not have text retry limits (LoopAgent handles this)."""
-    assert "Maximum 3" not in VALIDATOR_INSTRUCTION
-    assert "maximum 3" not in VALIDATOR_INSTRUCTION
+    assert re.search(r"maximum\s*3", VALIDATOR_INSTRUCTION, re.IGNORECASE) is None
+
+
+def test_validator_starts_with_combined_check() -> None:
+    """Validator runs every check in one call before any single re-check."""
+    combined = VALIDATOR_INSTRUCTION.index("validate_generated_content")
+    assert combined < VALIDATOR_INSTRUCTION.index("run_ruff_format")
+
+
+def test_dynamic_context_is_trailing() -> None:
+    """State placeholders come last so the static prefix stays cacheable."""
+    for instruction, placeholder in [
+        (CONTENT_PLANNER_INSTRUCTION, "{template_analysis}"),
+        (CODE_GENERATOR_INSTRUCTION, "{lesson_plan}"),
+        (VALIDATOR_INSTRUCTION, "{generated_code_summary}"),
+    ]:
+        assert instruction.endswith(f"## Context\n{placeholder}")
+        assert instruction.count("{") == 1
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import ast
+import typing as t
 
-import jinja2
 import pytest
 
 from content_generator.templates import (
+    _to_format_string,
     render_app_template,
     render_app_test_template,
     render_asyncio_lesson_template,
@@ -71,12 +72,7 @@ def test_render_lesson_template_future_annotations() -> None:
         module_docstring="Test.",
         body="pass",
     )
-    lines = result.split("\n")
-    future_line = next(
-        (i for i, line in enumerate(lines) if "__future__" in line),
-        None,
-    )
-    assert future_line is not None
+    assert "\nfrom __future__ import annotations\n" in result
 
 
 def test_render_asyncio_lesson_template_basic() -> None:
@@ -151,9 +147,51 @@ def test_render_app_test_template_valid_python() -> None:
     ast.parse(result)
 
 
-def test_strict_undefined_missing_variable_raises() -> None:
-    from content_generator.templates import _ENV
+def test_render_lesson_template_keeps_braces_in_content() -> None:
+    """Braces in rendered values are emitted verbatim, not re-formatted."""
+    body = 'MAPPING = {"a": 1}\nGREETING = f"{MAPPING}"'
+    result = render_lesson_template(module_docstring="Braces {x}.", body=body)
+    assert body in result
+    assert '"""Braces {x}."""' in result
+    ast.parse(result)
+
+
+class FormatStringFixture(t.NamedTuple):
+    """Test fixture for _to_format_string conversions."""
+
+    test_id: str
+    template: str
+    expected: str
+
+
+FORMAT_STRING_FIXTURES: list[FormatStringFixture] = [
+    FormatStringFixture(
+        test_id="placeholder",
+        template="x = {{ value }}",
+        expected="x = {value}",
+    ),
+    FormatStringFixture(
+        test_id="literal_braces",
+        template="d = {} {{ value }}",
+        expected="d = {{}} {value}",
+    ),
+    FormatStringFixture(
+        test_id="no_placeholders",
+        template="pass",
+        expected="pass",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(FormatStringFixture._fields),
+    FORMAT_STRING_FIXTURES,
+    ids=[f.test_id for f in FORMAT_STRING_FIXTURES],
+)
+def test_to_format_string(test_id: str, template: str, expected: str) -> None:
+    assert _to_format_string(template) == expected
+
 
-    template = _ENV.from_string("{{ missing_var }}")
-    with pytest.raises(jinja2.UndefinedError):
-        template.render()
+def test_render_missing_placeholder_raises() -> None:
+    with pytest.raises(KeyError, match="missing_var"):
+        _to_format_string("{{ missing_var }}").format()
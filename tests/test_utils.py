@@ -53,6 +53,21 @@ STRIP_FENCE_CASES: list[StripFenceCase] = [
         raw='```python\n"""A lesson."""\n\ndef main() -> None:\n    pass',
         expected='```python\n"""A lesson."""\n\ndef main() -> None:\n    pass',
     ),
+    StripFenceCase(
+        test_id="only_closing_fence_no_strip",
+        raw='"""A lesson."""\n\ndef main() -> None:\n    pass\n```',
+        expected='"""A lesson."""\n\ndef main() -> None:\n    pass\n```',
+    ),
+    StripFenceCase(
+        test_id="inner_fence_kept_outer_stripped",
+        raw="```markdown\nIntro\n```\ncode\n```\nOutro\n```",
+        expected="Intro\n```\ncode\n```\nOutro",
+    ),
+    StripFenceCase(
+        test_id="empty_fenced_block",
+        raw="```python\n```",
+        expected="",
+    ),
     StripFenceCase(
         test_id="backticks_inside_docstring_preserved",
         raw=(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pathlib
 import subprocess
+import threading
 
 import pytest
 
@@ -61,6 +62,19 @@ def test_run_tool_captures_stderr() -> None:
     assert "err" in output
 
 
+def test_run_tool_interleaves_stdout_and_stderr() -> None:
+    _ok, output = _run_tool(
+        [
+            "python",
+            "-c",
+            "import sys; print('one', flush=True);"
+            " print('two', file=sys.stderr, flush=True); print('three')",
+        ],
+        cwd=pathlib.Path(),
+    )
+    assert output.split() == ["one", "two", "three"]
+
+
 def test_run_ruff_format_success(monkeypatch: pytest.MonkeyPatch) -> None:
     mock_result = subprocess.CompletedProcess(
         args=[],
@@ -90,6 +104,25 @@ def test_run_ruff_check_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert ok is True
 
 
+def test_run_ruff_check_concise_without_fixes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen: list[list[str]] = []
+
+    def fake_run(args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        seen.append(args)
+        return subprocess.CompletedProcess(
+            args=args, returncode=0, stdout="", stderr=""
+        )
+
+    monkeypatch.setattr(validators_module.subprocess, "run", fake_run)
+    run_ruff_check(pathlib.Path("/fake/test.py"))
+    (args,) = seen
+    assert args[-1] == "/fake/test.py"
+    assert "--no-fix" in args
+    assert "--output-format=concise" in args
+
+
 def test_run_mypy_check_success(monkeypatch: pytest.MonkeyPatch) -> None:
     mock_result = subprocess.CompletedProcess(
         args=[],
@@ -119,6 +152,25 @@ def test_run_pytest_doctest_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert ok is True
 
 
+def test_run_pytest_doctest_disables_cache_provider(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen: list[list[str]] = []
+
+    def fake_run(args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        seen.append(args)
+        return subprocess.CompletedProcess(
+            args=args, returncode=0, stdout="", stderr=""
+        )
+
+    monkeypatch.setattr(validators_module.subprocess, "run", fake_run)
+    run_pytest_doctest(pathlib.Path("/fake/test.py"))
+    (args,) = seen
+    assert args[-1] == "/fake/test.py"
+    plugin_flag = args.index("-p")
+    assert args[plugin_flag + 1] == "no:cacheprovider"
+
+
 def test_run_pytest_doctest_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     mock_result = subprocess.CompletedProcess(
         args=[],
@@ -181,13 +233,9 @@ def test_validate_file_partial_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     project_path = get_project_path(TargetProject.DSA)
     fake_file = project_path / "src" / "test_generated.py"
 
-    call_count = 0
-
-    def mock_run(*args: object, **kwargs: object) -> subprocess.CompletedProcess[str]:
-        nonlocal call_count
-        call_count += 1
-        # Fail on the third call (mypy)
-        if call_count == 3:
+    def mock_run(args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        # Checks run concurrently, so fail by command rather than call order
+        if "mypy" in args:
             return subprocess.CompletedProcess(
                 args=[],
                 returncode=1,
@@ -205,3 +253,23 @@ def test_validate_file_partial_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     result = validate_file(fake_file, project_dir=project_path)
     assert result.passed is False
     assert "error" in result.mypy
+
+
+def test_validate_file_runs_checks_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """All four tools should be in flight at the same time."""
+    project_path = get_project_path(TargetProject.DSA)
+    fake_file = project_path / "src" / "test_generated.py"
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fake_run(*args: object, **kwargs: object) -> subprocess.CompletedProcess[str]:
+        barrier.wait()
+        return subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="OK\n", stderr=""
+        )
+
+    monkeypatch.setattr(validators_module.subprocess, "run", fake_run)
+    result = validate_file(fake_file, project_dir=project_path)
+    assert result.passed is True
+    assert result.pytest == "OK"